@@ -1,7 +1,31 @@
-__all__ = ("__version__", "core", "meta", "text")
+__all__ = ("__version__", "bench", "core", "meta", "stats", "text")
 
-from importlib import metadata
+# avoid importing typing at startup; type checkers treat this name as typing's
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from purekit import bench, core, meta, stats, text
 
-__version__ = metadata.version(__name__)
+    __version__: str
 
-from purekit import core, meta, text
+# submodules are imported on first attribute access to keep `import purekit` cheap
+_SUBMODULES = frozenset(("bench", "core", "meta", "stats", "text"))
+
+
+def __getattr__(name: str) -> object:
+    if name in _SUBMODULES:
+        from importlib import import_module
+
+        return import_module(f"{__name__}.{name}")
+
+    if name == "__version__":
+        # scanning distribution metadata is slow; resolve once, on demand
+        from importlib import metadata
+
+        version = globals()["__version__"] = metadata.version(__name__)
+        return version
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
@@ -0,0 +1,272 @@
+import argparse
+import os
+import re
+import sys
+from collections.abc import Callable, Iterator
+from io import BufferedIOBase
+from itertools import chain
+
+import purekit as pk
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from multiprocessing.pool import AsyncResult
+
+BLOCK_SIZE = 1 << 20
+
+Writer = Callable[[bytes], object]
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the purekit command line; return the process exit status."""
+    parser = argparse.ArgumentParser(
+        prog="purekit",
+        description="Stream text through purekit functions, like a shell filter.",
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("files", nargs="*", help="input files; '-' or none for stdin")
+    common.add_argument(
+        "-w", "--workers", type=int, default=1, help="process files in parallel"
+    )
+    regex = argparse.ArgumentParser(add_help=False)
+    regex.add_argument("pattern", help="regular expression")
+    regex.add_argument(
+        "-s", "--case-sensitive", action="store_true", help="match case exactly"
+    )
+
+    commands.add_parser(
+        "grep", parents=[regex, common], help="print lines matching a pattern"
+    )
+    commands.add_parser(
+        "findall", parents=[regex, common], help="print every match, one per line"
+    )
+    flatten_parser = commands.add_parser(
+        "flatten", parents=[common], help="print the leaves of JSON documents"
+    )
+    flatten_parser.add_argument("--max-depth", type=int, help="levels to flatten")
+    commands.add_parser(
+        "normalize", parents=[common], help="remove punctuation characters"
+    )
+
+    args = parser.parse_args(argv)
+    if args.workers < 1:
+        parser.error(f"invalid workers={args.workers!r}; expected >= 1")
+
+    try:
+        with open(
+            sys.stdout.fileno(), "wb", buffering=BLOCK_SIZE, closefd=False
+        ) as output:
+            process_all(args, output.write)
+    except BrokenPipeError:
+        # downstream closed early (e.g. `| head`); silence the flush at exit
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+    except (OSError, re.error, ValueError) as exc:
+        # ValueError covers malformed JSON input
+        print(f"purekit: error: {exc}", file=sys.stderr)
+        return 2
+    return 0
+
+
+def process_all(args: argparse.Namespace, write: Writer) -> None:
+    """Process every input in order, fanning files out to workers if requested."""
+    files = args.files or ["-"]
+    if args.workers == 1 or len(files) == 1 or "-" in files:
+        for path in files:
+            process_path(args, path, write)
+        return
+
+    import tempfile
+    from collections import deque
+    from multiprocessing import Pool
+
+    # workers spool their output to temporary files that are copied out in input
+    # order; at most two files per worker are submitted ahead of the one written
+    pending: deque[tuple[AsyncResult[None], str]] = deque()
+    with Pool(args.workers) as pool:
+        try:
+            for path in files:
+                fd, name = tempfile.mkstemp(prefix="purekit-")
+                os.close(fd)
+                result = pool.apply_async(process_to_file, (args, path, name))
+                pending.append((result, name))
+                if len(pending) > 2 * args.workers:
+                    copy_spooled(*pending.popleft(), write)
+            while pending:
+                copy_spooled(*pending.popleft(), write)
+        finally:
+            # on error, such as a closed pipe, kill workers instead of letting them
+            # finish their files, then remove whatever they spooled
+            pool.terminate()
+            for _, name in pending:
+                os.remove(name)
+
+
+def process_to_file(args: argparse.Namespace, path: str, name: str) -> None:
+    """Write the command output for one file to the named file; runs in a worker."""
+    with open(name, "wb", buffering=BLOCK_SIZE) as spool:
+        process_path(args, path, spool.write)
+
+
+def copy_spooled(result: "AsyncResult[None]", name: str, write: Writer) -> None:
+    """Write out the output a worker spooled to name in blocks, then remove it."""
+    try:
+        result.get()
+        with open(name, "rb") as spool:
+            while block := spool.read(BLOCK_SIZE):
+                write(block)
+    finally:
+        os.remove(name)
+
+
+def process_path(args: argparse.Namespace, path: str, write: Writer) -> None:
+    """Run the selected command over one file, or stdin for '-'."""
+    if path == "-":
+        COMMANDS[args.command](args, sys.stdin.buffer, write)
+        return
+    with open(path, "rb") as source:
+        COMMANDS[args.command](args, source, write)
+
+
+def read_lines(source: BufferedIOBase) -> Iterator[list[bytes]]:
+    """Yield lists of complete lines, newline included, read in large blocks."""
+    # a partial line is kept as pieces and joined once, when its newline arrives,
+    # so a long line without newlines costs linear rather than quadratic time
+    pieces: list[bytes] = []
+    while block := source.read(BLOCK_SIZE):
+        cut = block.rfind(b"\n") + 1
+        if not cut:
+            pieces.append(block)
+            continue
+        if pieces:
+            pieces.append(block[:cut])
+            yield split_lines(b"".join(pieces))
+            pieces.clear()
+        else:
+            yield split_lines(block[:cut])
+        if cut < len(block):
+            pieces.append(block[cut:])
+    if pieces:
+        pieces.append(b"\n")
+        yield [b"".join(pieces)]
+
+
+def read_json(source: BufferedIOBase) -> Iterator[object]:
+    """Yield the concatenated UTF-8 JSON documents of source, read in large blocks.
+
+    Objects are decoded as the list of their values.
+    """
+    import codecs
+    import json
+
+    # objects contribute their values, so the leaves are the JSON scalars
+    parse = json.JSONDecoder(object_hook=lambda obj: list(obj.values())).raw_decode
+    whitespace = re.compile(r"[ \t\n\r]*")
+    decode = codecs.getincrementaldecoder("utf-8")().decode
+    buffer = ""
+    pieces: list[str] = []
+    size = 0
+    while True:
+        block = source.read(BLOCK_SIZE)
+        final = not block
+        pieces.append(decode(block, final))
+        size += len(pieces[-1])
+        # an unfinished document is retried only once the buffer has doubled, so a
+        # document spanning many blocks costs linear rather than quadratic time
+        if not final and size < len(buffer):
+            continue
+        buffer = "".join([buffer, *pieces])
+        pieces.clear()
+        size = 0
+        pos = 0
+        while (pos := whitespace.match(buffer, pos).end()) < len(buffer):
+            try:
+                document, end = parse(buffer, pos)
+            except json.JSONDecodeError:
+                if final:
+                    raise
+                break
+            # a number at the end of the buffer may continue in the next block
+            if end == len(buffer) and not final:
+                break
+            yield document
+            pos = end
+        if final:
+            return
+        buffer = buffer[pos:]
+
+
+def split_lines(data: bytes) -> list[bytes]:
+    """Return the newline-terminated lines of data, keeping bare carriage returns."""
+    # bytes.splitlines is faster but also splits on a bare b"\r"
+    if b"\r" not in data:
+        return data.splitlines(keepends=True)
+    return [line + b"\n" for line in data.split(b"\n")[:-1]]
+
+
+def compile_pattern(args: argparse.Namespace) -> re.Pattern[bytes]:
+    """Return the bytes regex for the pattern argument."""
+    flags = re.NOFLAG if args.case_sensitive else re.IGNORECASE
+    return re.compile(os.fsencode(args.pattern), flags)
+
+
+def run_grep(args: argparse.Namespace, source: BufferedIOBase, write: Writer) -> None:
+    """Write the lines matching the pattern."""
+    regex = compile_pattern(args)
+    for lines in read_lines(source):
+        write(b"".join(pk.text.grep(lines, regex)))
+
+
+def run_findall(
+    args: argparse.Namespace, source: BufferedIOBase, write: Writer
+) -> None:
+    """Write every match of the pattern on its own line."""
+    regex = compile_pattern(args)
+    for lines in read_lines(source):
+        # the per-line lists hold only matches, so skip flatten's per-item checks
+        matches = chain.from_iterable(pk.text.findall(lines, regex))
+        write(b"".join(format_match(match) for match in matches))
+
+
+def run_flatten(
+    args: argparse.Namespace, source: BufferedIOBase, write: Writer
+) -> None:
+    """Write each leaf of the JSON documents, such as NDJSON records, as JSON lines."""
+    import json
+
+    for document in read_json(source):
+        items = document if isinstance(document, list) else [document]
+        write(
+            b"".join(
+                json.dumps(item).encode() + b"\n"
+                for item in pk.core.flatten(items, max_depth=args.max_depth)
+            )
+        )
+
+
+def run_normalize(
+    args: argparse.Namespace, source: BufferedIOBase, write: Writer
+) -> None:
+    """Write the input with punctuation characters removed."""
+    # punctuation is ASCII, which never occurs inside multi-byte UTF-8 sequences,
+    # so blocks can be translated without splitting them into lines
+    while block := source.read(BLOCK_SIZE):
+        write(pk.text.remove_punctuation(block))
+
+
+def format_match(match: bytes | tuple[bytes, ...]) -> bytes:
+    """Return one output line for a match, joining regex groups with tabs."""
+    return (b"\t".join(match) if isinstance(match, tuple) else match) + b"\n"
+
+
+COMMANDS: dict[str, Callable[[argparse.Namespace, BufferedIOBase, Writer], None]] = {
+    "findall": run_findall,
+    "flatten": run_flatten,
+    "grep": run_grep,
+    "normalize": run_normalize,
+}
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,186 @@
+"""Benchmark suite for purekit hot paths with regression comparison.
+
+Example:
+$ python -m purekit.bench run --output before.json
+$ python -m purekit.bench run --output after.json
+$ python -m purekit.bench compare before.json after.json
+"""
+
+__all__ = (
+    "WORKLOADS",
+    "Comparison",
+    "compare",
+    "gil_enabled",
+    "measure",
+    "run",
+    "scaling",
+)
+
+import fnmatch
+import math
+import platform
+import statistics
+import sys
+import time
+import timeit
+from collections.abc import Callable, Sequence
+from typing import Any, NamedTuple
+
+import purekit as pk
+from purekit.bench.workloads import WORKLOADS
+
+
+class Comparison(NamedTuple):
+    """Timing change of one benchmark between two result sets."""
+
+    name: str
+    old_mean: float
+    new_mean: float
+    ratio: float
+    t_stat: float
+    verdict: str
+
+
+def measure(
+    func: Callable[[], Any],
+    repeat: int = 7,
+    min_time: float = 0.05,
+) -> dict[str, Any]:
+    """Return per-call timing samples for func, calibrating the loop count."""
+    if repeat < 2:
+        raise ValueError(f"invalid {repeat=!r}; expected >= 2")
+
+    timer = timeit.Timer(func)
+    number = 1
+    while (elapsed := timer.timeit(number)) < min_time:
+        # scale towards min_time, at most 10x per step
+        number *= min(10, max(2, math.ceil(min_time / max(elapsed, 1e-9))))
+
+    samples = [timer.timeit(number) / number for _ in range(repeat)]
+    return {
+        "number": number,
+        "samples": samples,
+        "mean": statistics.fmean(samples),
+        "stdev": statistics.stdev(samples),
+        "min": min(samples),
+    }
+
+
+def run(
+    pattern: str = "*",
+    repeat: int = 7,
+    min_time: float = 0.05,
+    progress: Callable[[str, dict[str, Any]], None] | None = None,
+) -> dict[str, Any]:
+    """Return JSON-serializable results for workloads whose name matches pattern."""
+    benchmarks = {}
+    for name, setup in WORKLOADS.items():
+        if not fnmatch.fnmatchcase(name, pattern):
+            continue
+        benchmarks[name] = measure(setup(), repeat=repeat, min_time=min_time)
+        if progress is not None:
+            progress(name, benchmarks[name])
+
+    return {
+        "purekit": pk.__version__,
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "gil_enabled": gil_enabled(),
+        "benchmarks": benchmarks,
+    }
+
+
+def scaling(
+    pattern: str = "*",
+    threads: Sequence[int] = (1, 2, 4, 8),
+    repeat: int = 3,
+    progress: Callable[[str, dict[str, float]], None] | None = None,
+) -> dict[str, Any]:
+    """Return the speedup of running matching workloads from several threads.
+
+    For each thread count, ``2 * max(threads)`` workload calls are spread over that
+    many threads and the best of `repeat` wall times is kept; speedups are relative
+    to the first thread count. Real speedups require a free-threaded build.
+    """
+    if not threads or min(threads) < 1:
+        raise ValueError(f"invalid {threads=!r}; expected counts >= 1")
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    tasks = 2 * max(threads)
+    benchmarks = {}
+    for name, setup in WORKLOADS.items():
+        if not fnmatch.fnmatchcase(name, pattern):
+            continue
+        func = setup()
+        seconds = {}
+        for count in threads:
+            with ThreadPoolExecutor(max_workers=count) as executor:
+                best = math.inf
+                for _ in range(repeat):
+                    start = time.perf_counter()
+                    for future in [executor.submit(func) for _ in range(tasks)]:
+                        future.result()
+                    best = min(best, time.perf_counter() - start)
+            seconds[str(count)] = best
+        base = seconds[str(threads[0])]
+        speedup = {count: base / elapsed for count, elapsed in seconds.items()}
+        benchmarks[name] = {"seconds": seconds, "speedup": speedup}
+        if progress is not None:
+            progress(name, speedup)
+
+    return {
+        "purekit": pk.__version__,
+        "python": platform.python_version(),
+        "gil_enabled": gil_enabled(),
+        "threads": list(threads),
+        "benchmarks": benchmarks,
+    }
+
+
+def compare(
+    old: dict[str, Any],
+    new: dict[str, Any],
+    threshold: float = 0.05,
+    min_t: float = 3.0,
+) -> list[Comparison]:
+    """Return the timing change of each benchmark present in both result sets.
+
+    A change is significant when the means differ by more than `threshold` (relative)
+    and Welch's t statistic exceeds `min_t` in magnitude; with the default 7 samples
+    per side, 3.0 corresponds to roughly p < 0.01.
+    """
+    comparisons = []
+    for name, new_result in new["benchmarks"].items():
+        old_result = old["benchmarks"].get(name)
+        if old_result is None:
+            continue
+
+        old_mean, new_mean = old_result["mean"], new_result["mean"]
+        ratio = new_mean / old_mean
+        t_stat = _welch_t(old_result["samples"], new_result["samples"])
+        if abs(ratio - 1) < threshold or abs(t_stat) < min_t:
+            verdict = "same"
+        else:
+            verdict = "slower" if ratio > 1 else "faster"
+        comparisons.append(Comparison(name, old_mean, new_mean, ratio, t_stat, verdict))
+
+    return comparisons
+
+
+def gil_enabled() -> bool:
+    """Return False on free-threaded builds running without the GIL."""
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    return True if is_gil_enabled is None else is_gil_enabled()
+
+
+def _welch_t(old: list[float], new: list[float]) -> float:
+    """Return Welch's t statistic for the difference of means new - old."""
+    diff = statistics.fmean(new) - statistics.fmean(old)
+    stderr = math.sqrt(
+        statistics.variance(old) / len(old) + statistics.variance(new) / len(new)
+    )
+    if stderr == 0:
+        return 0.0 if diff == 0 else math.copysign(math.inf, diff)
+    return diff / stderr
@@ -0,0 +1,120 @@
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Any
+
+import purekit as pk
+from purekit import bench
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the benchmark command line; return the process exit status."""
+    parser = argparse.ArgumentParser(
+        prog="python -m purekit.bench",
+        description="Benchmark purekit hot paths and compare result files.",
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="run benchmarks")
+    run_parser.add_argument("-o", "--output", type=Path, help="write JSON results")
+    run_parser.add_argument(
+        "-k", "--filter", default="*", help="glob matched against benchmark names"
+    )
+    run_parser.add_argument("--repeat", type=int, default=7, help="samples per bench")
+    run_parser.add_argument(
+        "--min-time", type=float, default=0.05, help="seconds per sample (minimum)"
+    )
+
+    compare_parser = commands.add_parser("compare", help="compare two result files")
+    compare_parser.add_argument("old", type=Path)
+    compare_parser.add_argument("new", type=Path)
+    compare_parser.add_argument(
+        "--threshold", type=float, default=0.05, help="relative change to report"
+    )
+    compare_parser.add_argument(
+        "--min-t", type=float, default=3.0, help="Welch t statistic to report"
+    )
+
+    scaling_parser = commands.add_parser(
+        "scaling", help="measure multi-threaded speedup"
+    )
+    scaling_parser.add_argument("-o", "--output", type=Path, help="write JSON results")
+    scaling_parser.add_argument(
+        "-k", "--filter", default="*", help="glob matched against benchmark names"
+    )
+    scaling_parser.add_argument(
+        "--threads",
+        type=lambda value: [int(count) for count in value.split(",")],
+        default=[1, 2, 4, 8],
+        help="comma-separated thread counts",
+    )
+    scaling_parser.add_argument("--repeat", type=int, default=3, help="runs per count")
+
+    commands.add_parser("list", help="list benchmark names")
+
+    args = parser.parse_args(argv)
+    if args.command == "run":
+        return run(args.output, args.filter, args.repeat, args.min_time)
+    if args.command == "compare":
+        return compare(args.old, args.new, args.threshold, args.min_t)
+    if args.command == "scaling":
+        return scaling(args.output, args.filter, args.threads, args.repeat)
+    print(*bench.WORKLOADS, sep="\n")
+    return 0
+
+
+def run(output: Path | None, pattern: str, repeat: int, min_time: float) -> int:
+    """Run matching benchmarks, print a summary and optionally save the results."""
+    print(pk.text.headline(f"purekit {pk.__version__} benchmarks"))
+
+    def progress(name: str, result: dict[str, Any]) -> None:
+        mean_us = result["mean"] * 1e6
+        stdev = result["stdev"] / result["mean"]
+        print(f"{name:<44} {mean_us:>14,.1f} us  +- {stdev:6.1%}", flush=True)
+
+    results = bench.run(pattern, repeat=repeat, min_time=min_time, progress=progress)
+    if not results["benchmarks"]:
+        print(f"no benchmarks match {pattern!r}", file=sys.stderr)
+        return 2
+    if output is not None:
+        output.write_text(json.dumps(results, indent=2) + "\n", encoding="utf-8")
+    return 0
+
+
+def scaling(output: Path | None, pattern: str, threads: list[int], repeat: int) -> int:
+    """Run matching benchmarks from several threads and print the speedups."""
+    gil = "enabled" if bench.gil_enabled() else "disabled"
+    print(pk.text.headline(f"speedup by thread count (GIL {gil})"))
+    print(f"{'threads':<44}", *(f"{count:>7}" for count in threads))
+
+    def progress(name: str, speedup: dict[str, float]) -> None:
+        print(f"{name:<44}", *(f"{value:>6.2f}x" for value in speedup.values()))
+
+    results = bench.scaling(pattern, threads, repeat=repeat, progress=progress)
+    if not results["benchmarks"]:
+        print(f"no benchmarks match {pattern!r}", file=sys.stderr)
+        return 2
+    if output is not None:
+        output.write_text(json.dumps(results, indent=2) + "\n", encoding="utf-8")
+    return 0
+
+
+def compare(old: Path, new: Path, threshold: float, min_t: float) -> int:
+    """Print the change per benchmark; return 1 if any became significantly slower."""
+    comparisons = bench.compare(
+        json.loads(old.read_text(encoding="utf-8")),
+        json.loads(new.read_text(encoding="utf-8")),
+        threshold=threshold,
+        min_t=min_t,
+    )
+    print(pk.text.headline(f"{old.name} -> {new.name}"))
+    for item in comparisons:
+        print(
+            f"{item.name:<44} {item.ratio:7.3f}x  t={item.t_stat:7.2f}  {item.verdict}"
+        )
+    return 1 if any(item.verdict == "slower" for item in comparisons) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
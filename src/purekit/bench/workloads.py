@@ -0,0 +1,131 @@
+"""Representative workloads for the purekit hot paths."""
+
+__all__ = ("WORKLOADS",)
+
+import re
+from collections.abc import Callable
+from typing import Any
+
+import purekit as pk
+
+Workload = Callable[[], Callable[[], Any]]
+
+WORKLOADS: dict[str, Workload] = {}
+
+
+def workload(name: str) -> Callable[[Workload], Workload]:
+    """Register a setup function returning the zero-argument callable to time."""
+
+    def register(func: Workload) -> Workload:
+        WORKLOADS[name] = func
+        return func
+
+    return register
+
+
+def _deep(depth: int) -> list[Any]:
+    nested: list[Any] = [depth]
+    for level in range(depth - 1, 0, -1):
+        nested = [level, nested]
+    return nested
+
+
+def _lines(n: int) -> list[str]:
+    levels = ("INFO", "DEBUG", "WARNING", "ERROR")
+    return [
+        f"2024-01-01T00:00:{i % 60:02d} {levels[i % 4]} worker-{i % 16} "
+        f"request id={i} took {i % 997}ms status={200 + (i % 5) * 100}"
+        for i in range(n)
+    ]
+
+
+@workload("core.flatten[deep]")
+def core_flatten_deep() -> Callable[[], Any]:
+    items = _deep(500)
+    return lambda: list(pk.core.flatten(items))
+
+
+@workload("core.flatten[wide]")
+def core_flatten_wide() -> Callable[[], Any]:
+    items = [list(range(100)) for _ in range(1_000)]
+    return lambda: list(pk.core.flatten(items))
+
+
+@workload("core.flatten[mixed]")
+def core_flatten_mixed() -> Callable[[], Any]:
+    items = [[f"s{i}", (i, [i + 1, {i}]), b"raw", range(3)] for i in range(2_000)]
+    return lambda: list(pk.core.flatten(items))
+
+
+@workload("text.grep[str-pattern]")
+def text_grep_str_pattern() -> Callable[[], Any]:
+    lines = _lines(20_000)
+    return lambda: list(pk.text.grep(lines, r"error.*status=5\d\d"))
+
+
+@workload("text.grep[compiled-pattern]")
+def text_grep_compiled_pattern() -> Callable[[], Any]:
+    lines = _lines(20_000)
+    regex = re.compile(r"worker-1[0-5]\b")
+    return lambda: list(pk.text.grep(lines, regex))
+
+
+@workload("text.grep[bytes]")
+def text_grep_bytes() -> Callable[[], Any]:
+    lines = [line.encode() for line in _lines(20_000)]
+    return lambda: list(pk.text.grep(lines, rb"error.*status=5\d\d"))
+
+
+@workload("text.findall[repeated-pattern]")
+def text_findall_repeated_pattern() -> Callable[[], Any]:
+    lines = _lines(20_000)
+    return lambda: list(pk.text.findall(lines, r"\b\d+ms\b"))
+
+
+@workload("text.concat[flat]")
+def text_concat_flat() -> Callable[[], Any]:
+    strings = [f"word{i}" for i in range(10_000)]
+    return lambda: pk.text.concat(strings)
+
+
+@workload("text.concat[nested]")
+def text_concat_nested() -> Callable[[], Any]:
+    strings = [[f"a{i}", None, [f"b{i}", i]] for i in range(3_000)]
+    return lambda: pk.text.concat(strings, sep=",")
+
+
+@workload("text.concat[bytes]")
+def text_concat_bytes() -> Callable[[], Any]:
+    strings = [f"word{i}".encode() for i in range(10_000)]
+    return lambda: pk.text.concat(strings, sep=b" ")
+
+
+@workload("text.numstr[mixed]")
+def text_numstr() -> Callable[[], Any]:
+    values = [i * 1_234.5678 if i % 2 else i * 1_000_003 for i in range(5_000)]
+    return lambda: [pk.text.numstr(value) for value in values]
+
+
+@workload("meta.caller_info[1k-calls]")
+def meta_caller_info() -> Callable[[], Any]:
+    caller_info = pk.meta.caller_info
+    return lambda: [caller_info() for _ in range(1_000)]
+
+
+@workload("meta.get_caller_module+name[1k-calls]")
+def meta_get_caller_module_and_name() -> Callable[[], Any]:
+    get_module = pk.meta.get_caller_module
+    get_name = pk.meta.get_caller_name
+    return lambda: [(get_module(), get_name()) for _ in range(1_000)]
+
+
+@workload("text.grep[workers=4]")
+def text_grep_workers() -> Callable[[], Any]:
+    lines = _lines(20_000)
+    return lambda: list(pk.text.grep(lines, r"error.*status=5\d\d", workers=4))
+
+
+@workload("text.findall[workers=4]")
+def text_findall_workers() -> Callable[[], Any]:
+    lines = _lines(20_000)
+    return lambda: list(pk.text.findall(lines, r"\b\d+ms\b", workers=4))
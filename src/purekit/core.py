@@ -1,9 +1,12 @@
 __all__ = ["flatten"]
 
+import time
 from collections import deque
 from collections.abc import Iterable, Iterator
 from typing import Any
 
+import purekit as pk
+
 
 def flatten(
     items: Iterable[Any],
@@ -24,6 +27,11 @@ def flatten(
         raise ValueError(f"invalid {max_depth=!r}; expected >= 0 or None")
 
     stack = deque([(iter(items), 0)])
+    collector = pk.stats.current()
+    if collector is not None:
+        yield from _flatten_counted(stack, max_depth, atomic_types_tuple, collector)
+        return
+
     while stack:
         iterator, depth = stack[-1]
         try:
@@ -40,3 +48,46 @@ def flatten(
             stack.append((iter(item), depth + 1))
         else:
             yield item
+
+
+def _flatten_counted(
+    stack: deque,
+    max_depth: int | None,
+    atomic_types: tuple[type, ...],
+    collector: "pk.stats.Collector",
+) -> Iterator[Any]:
+    """Run the flatten loop while counting items visited and the depth reached."""
+    visited = 0
+    deepest = 0
+    paused = 0.0
+    start = time.perf_counter()
+    try:
+        while stack:
+            iterator, depth = stack[-1]
+            try:
+                item = next(iterator)
+            except StopIteration:
+                stack.pop()
+                continue
+
+            visited += 1
+            if (
+                (max_depth is None or depth < max_depth)
+                and isinstance(item, Iterable)
+                and not isinstance(item, atomic_types)
+            ):
+                stack.append((iter(item), depth + 1))
+                deepest = max(deepest, depth + 1)
+            else:
+                suspended = time.perf_counter()
+                yield item
+                paused += time.perf_counter() - suspended
+    finally:
+        collector.add(
+            {
+                "core.flatten.calls": 1,
+                "core.flatten.items": visited,
+                "core.flatten.seconds": time.perf_counter() - start - paused,
+            }
+        )
+        collector.maximum("core.flatten.max_depth", deepest)
@@ -1,59 +1,518 @@
-__all__ = ("get_caller_module", "get_caller_name", "get_caller_varname")
+__all__ = (
+    "AllocationSite",
+    "CallerInfo",
+    "Sampler",
+    "caller_info",
+    "get_caller_module",
+    "get_caller_name",
+    "get_caller_varname",
+    "get_caller_varnames",
+    "track_allocations",
+)
 
-import inspect
+import contextlib
+import sys
+import threading
+from collections import Counter
+from collections.abc import Iterable, Sequence
+from types import CodeType, FrameType
+from typing import Any, NamedTuple, Self
 
+# static per-code-object details: id(code) -> (code, (module, function, qualname,
+# filename)); keyed by identity since equal code objects may come from other files,
+# and the stored code object keeps its id from being reused while cached
+_CODE_INFO: dict[int, tuple[CodeType, tuple[str, str, str, str]]] = {}
+_CODE_INFO_MAXSIZE = 4096
 
-def get_caller_module(depth: int = 1) -> str:
-    """Return the module name of the calling frame; depth=1 is the immediate caller."""
+# caller_info results per call site: id(code) -> (code, {f_lasti: CallerInfo});
+# a call site always maps to the same line, so f_lineno is only read on a miss
+_CALLER_INFO: dict[int, tuple[CodeType, dict[int, "CallerInfo"]]] = {}
+_new_tuple = tuple.__new__
+
+# trackers currently active, and whether they started tracemalloc themselves
+_TRACKING_LOCK = threading.Lock()
+_tracking_users = 0
+_tracking_started = False
+
+# source file -> name of the module loaded from it
+_FILE_MODULES: dict[str, str] = {}
+_FILE_MODULES_MAXSIZE = 4096
+
+# source file -> (first line, last line, qualname) of each def/class, innermost last
+_SOURCE_SCOPES: dict[str, list[tuple[int, int, str]]] = {}
+_SOURCE_SCOPES_MAXSIZE = 256
+
+
+class AllocationSite(NamedTuple):
+    """Memory allocated by one function, as reported by track_allocations."""
+
+    module: str
+    function: str
+    size: int
+    count: int
+
+
+class CallerInfo(NamedTuple):
+    """Details about a calling frame."""
+
+    module: str
+    function: str
+    qualname: str
+    filename: str
+    lineno: int
+
+
+class track_allocations(contextlib.ContextDecorator):
+    """Context manager and decorator reporting the top allocation sites.
+
+    Allocations traced by ``tracemalloc`` are grouped by the module and qualified
+    function name of the innermost frame whose module does not start with one of the
+    `exclude` prefixes; `nframe` is the traceback depth stored per allocation, so
+    excluded modules need a depth large enough to reach their callers. Entering
+    raises RuntimeError if tracemalloc already traces fewer than `nframe` frames, for
+    example inside an outer tracker with a smaller `nframe`. With ``diff=True`` the
+    sites report growth between entering and exiting, otherwise memory still
+    allocated on exit. Tracing is stopped when the last active tracker exits, and
+    only if a tracker started it.
+
+    Example:
+    >>> with track_allocations(limit=3) as tracker:
+    ...     data = [str(i) for i in range(1000)]
+    >>> sites = tracker.sites
+    """
+
+    def __init__(
+        self,
+        limit: int | None = 10,
+        nframe: int = 1,
+        diff: bool = True,
+        exclude: Sequence[str] = (),
+    ) -> None:
+        if limit is not None and limit < 1:
+            raise ValueError(f"invalid {limit=!r}; expected >= 1 or None")
+        if nframe < 1:
+            raise ValueError(f"invalid {nframe=!r}; expected >= 1")
+        self.limit = limit
+        self.nframe = nframe
+        self.diff = diff
+        self.exclude = tuple(exclude)
+        self.sites: list[AllocationSite] = []
+        # one start snapshot per active entry, so nested entries do not clash
+        self._starts: list[Any] = []
+        self._owner: track_allocations | None = None
+
+    def __enter__(self) -> Self:
+        _acquire_tracing(self.nframe)
+        self._starts.append(self.checkpoint() if self.diff else None)
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        end = self.checkpoint()
+        start = self._starts.pop()
+        _release_tracing()
+        self.sites = self.top(end) if start is None else self.compare(start, end)
+        if self._owner is not None:
+            self._owner.sites = self.sites
+
+    def _recreate_cm(self) -> Self:
+        # each decorated call, recursive or concurrent, tracks with its own copy
+        clone = type(self)(self.limit, self.nframe, self.diff, self.exclude)
+        clone._owner = self
+        return clone
+
+    def checkpoint(self) -> Any:
+        """Return a tracemalloc snapshot without allocations made by the tracer."""
+        import tracemalloc
+
+        return tracemalloc.take_snapshot().filter_traces(
+            (
+                tracemalloc.Filter(False, tracemalloc.__file__),
+                tracemalloc.Filter(False, "<frozen importlib._bootstrap*>"),
+                tracemalloc.Filter(False, "<unknown>"),
+            )
+        )
+
+    def top(self, snapshot: Any) -> list[AllocationSite]:
+        """Return the sites holding the most memory in the snapshot."""
+        return self._group(
+            (stat.traceback, stat.size, stat.count)
+            for stat in snapshot.statistics("traceback")
+        )
+
+    def compare(self, old: Any, new: Any) -> list[AllocationSite]:
+        """Return the sites whose memory grew the most from old to new snapshot."""
+        sites = self._group(
+            (stat.traceback, stat.size_diff, stat.count_diff)
+            for stat in new.compare_to(old, "traceback")
+        )
+        return [site for site in sites if site.size > 0]
+
+    def _group(self, stats: Iterable[tuple[Any, int, int]]) -> list[AllocationSite]:
+        totals: dict[tuple[str, str], list[int]] = {}
+        # per-report memo; files of no imported module are not cached globally
+        modules: dict[str, str] = {}
+        for traceback, size, count in stats:
+            key = self._attribute(traceback, modules)
+            total = totals.setdefault(key, [0, 0])
+            total[0] += size
+            total[1] += count
+
+        sites = [
+            AllocationSite(module, function, size, count)
+            for (module, function), (size, count) in totals.items()
+        ]
+        sites.sort(key=lambda site: site.size, reverse=True)
+        return sites[: self.limit]
+
+    def _attribute(
+        self, traceback: Sequence[Any], modules: dict[str, str]
+    ) -> tuple[str, str]:
+        # frames are ordered oldest first; fall back to the innermost frame
+        frame = traceback[-1]
+        for candidate in reversed(traceback):
+            filename = candidate.filename
+            if filename not in modules:
+                modules[filename] = _module_for_file(filename)
+            if not modules[filename].startswith(self.exclude):
+                frame = candidate
+                break
+        # every frame up to the fallback was visited, so its module is memoized
+        module = modules[frame.filename]
+        return module, _function_for_line(frame.filename, frame.lineno)
+
+
+class Sampler:
+    """Background sampler aggregating thread stacks by module and function.
+
+    Every `interval` seconds a daemon thread snapshots ``sys._current_frames()``
+    and counts each stack, outermost frame first, as ``module:qualname`` labels;
+    `max_depth` bounds how many innermost frames are kept per stack.
+
+    Example:
+    >>> with Sampler(interval=0.01) as sampler:
+    ...     pass
+    >>> text = sampler.collapsed()
+    """
+
+    def __init__(self, interval: float = 0.01, max_depth: int = 64) -> None:
+        if interval <= 0:
+            raise ValueError(f"invalid {interval=!r}; expected > 0")
+        if max_depth < 1:
+            raise ValueError(f"invalid {max_depth=!r}; expected >= 1")
+        self.interval = interval
+        self.max_depth = max_depth
+        self.samples = 0
+        self._counts: Counter[tuple[str, ...]] = Counter()
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def __enter__(self) -> Self:
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.stop()
+
+    @property
+    def running(self) -> bool:
+        """Return True while the background thread is sampling."""
+        return self._thread is not None
+
+    def start(self) -> None:
+        """Start sampling in a background daemon thread."""
+        if self._thread is not None:
+            raise RuntimeError("sampler is already running")
+        self._stopped.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="purekit-sampler", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop sampling and wait for the background thread to exit."""
+        if self._thread is None:
+            return
+        self._stopped.set()
+        self._thread.join()
+        self._thread = None
+
+    def sample(self) -> None:
+        """Record one snapshot of every thread stack except the calling thread."""
+        own_ident = threading.get_ident()
+        stacks = []
+        frames = sys._current_frames()
+        try:
+            for ident, frame in frames.items():
+                if ident != own_ident:
+                    stacks.append(self._stack(frame))
+        finally:
+            del frames
+
+        with self._lock:
+            self.samples += 1
+            self._counts.update(stacks)
+
+    def counts(self) -> dict[tuple[str, ...], int]:
+        """Return a copy of the sample count per stack."""
+        with self._lock:
+            return dict(self._counts)
+
+    def collapsed(self) -> str:
+        """Return the counts in collapsed-stack format for flamegraph tools."""
+        return "\n".join(
+            f"{';'.join(stack)} {count}"
+            for stack, count in sorted(self.counts().items())
+        )
+
+    def clear(self) -> None:
+        """Discard all recorded samples."""
+        with self._lock:
+            self.samples = 0
+            self._counts.clear()
+
+    def _run(self) -> None:
+        while not self._stopped.wait(self.interval):
+            self.sample()
+
+    def _stack(self, frame: FrameType | None) -> tuple[str, ...]:
+        labels = []
+        while frame is not None and len(labels) < self.max_depth:
+            info = _code_info(frame)
+            labels.append(f"{info[0]}:{info[2]}")
+            frame = frame.f_back
+        labels.reverse()
+        return tuple(labels)
+
+
+def caller_info(depth: int = 1) -> CallerInfo:
+    """Return details about the calling frame; depth=1 is the immediate caller."""
     if depth < 1:
         raise ValueError(f"invalid {depth=!r}; expected >= 1")
 
-    frame = inspect.currentframe()
+    # inlined frame lookup and cache hit: helper calls and reading f_lineno cost
+    # more than the rest of this hot path
     try:
-        caller = frame
-        for _ in range(depth):
-            caller = caller.f_back if caller is not None else None
-        if caller is None:
-            raise RuntimeError("expected to be executed within a function")
-        return caller.f_globals.get("__name__", "<unknown>")
+        frame = sys._getframe(depth)
+    except ValueError:
+        raise RuntimeError("expected to be executed within a function") from None
+
+    code = frame.f_code
+    # the module comes from the globals, which may differ between runs of one code
+    # object (e.g. exec or eval), so a cached result is only reused if it matches
+    module = frame.f_globals.get("__name__", "<unknown>")
+    entry = _CALLER_INFO.get(id(code))
+    if entry is not None and entry[0] is code:
+        info = entry[1].get(frame.f_lasti)
+        if info is not None and info[0] == module:
+            return info
+    else:
+        if len(_CALLER_INFO) >= _CODE_INFO_MAXSIZE:
+            _CALLER_INFO.clear()
+        entry = _CALLER_INFO[id(code)] = (code, {})
+
+    # bypass the keyword-handling namedtuple constructor
+    info = _new_tuple(
+        CallerInfo,
+        (
+            module,
+            code.co_name,
+            code.co_qualname,
+            code.co_filename,
+            frame.f_lineno,
+        ),
+    )
+    entry[1][frame.f_lasti] = info
+    return info
+
+
+def get_caller_module(depth: int = 1) -> str:
+    """Return the module name of the calling frame; depth=1 is the immediate caller."""
+    frame = _caller_frame(depth)
+    try:
+        return frame.f_globals.get("__name__", "<unknown>")
     finally:
         del frame
 
 
 def get_caller_name(depth: int = 1) -> str:
     """Return the name of the calling function; depth=1 is the immediate caller."""
-    if depth < 1:
-        raise ValueError(f"invalid {depth=!r}; expected >= 1")
-
-    frame = inspect.currentframe()
+    frame = _caller_frame(depth)
     try:
-        caller = frame
-        for _ in range(depth):
-            caller = caller.f_back if caller is not None else None
-        if caller is None:
-            raise RuntimeError("expected to be executed within a function")
-        return caller.f_code.co_name
+        return frame.f_code.co_name
     finally:
         del frame
 
 
 def get_caller_varname(target: object, depth: int = 1) -> str:
     """Return the caller-local name bound to the given object."""
-    if depth < 1:
-        raise ValueError(f"invalid {depth=!r}; expected >= 1")
-
-    frame = inspect.currentframe()
+    frame = _caller_frame(depth)
     try:
-        caller = frame
-        for _ in range(depth):
-            caller = caller.f_back if caller is not None else None
-        if caller is None:
-            raise RuntimeError("expected to be executed within a function")
-
-        for name, val in caller.f_locals.items():
+        for name, val in frame.f_locals.items():
             if val is target:
                 return name
 
         raise ValueError("name not found")
     finally:
         del frame
+
+
+def get_caller_varnames(*targets: object, depth: int = 1) -> list[list[str]]:
+    """Return the caller names bound to each target, in one scan of the frame.
+
+    Locals, including closure cells and free variables, are searched first; targets
+    without a local name fall back to the caller's globals. A target bound to no name
+    maps to an empty list.
+    """
+    frame = _caller_frame(depth)
+    try:
+        names: list[list[str]] = [[] for _ in targets]
+        positions: dict[int, list[int]] = {}
+        for pos, target in enumerate(targets):
+            positions.setdefault(id(target), []).append(pos)
+
+        # on 3.13+ f_locals is a write-through proxy read in place, not a dict copy
+        local_ns = frame.f_locals
+        _collect_names(local_ns.items(), positions, names)
+        if local_ns is not frame.f_globals:
+            unresolved = {
+                key: [pos for pos in group if not names[pos]]
+                for key, group in positions.items()
+            }
+            unresolved = {key: group for key, group in unresolved.items() if group}
+            if unresolved:
+                _collect_names(frame.f_globals.items(), unresolved, names)
+
+        return names
+    finally:
+        del frame
+
+
+def _caller_frame(depth: int) -> FrameType:
+    """Return the frame `depth` levels above the function calling this helper."""
+    if depth < 1:
+        raise ValueError(f"invalid {depth=!r}; expected >= 1")
+
+    try:
+        # skip this helper and the public function that called it
+        return sys._getframe(depth + 1)
+    except ValueError:
+        raise RuntimeError("expected to be executed within a function") from None
+
+
+def _collect_names(
+    items: Iterable[tuple[str, object]],
+    positions: dict[int, list[int]],
+    names: list[list[str]],
+) -> None:
+    """Append each name whose value is a target to that target's name lists."""
+    for name, val in items:
+        group = positions.get(id(val))
+        if group is not None:
+            for pos in group:
+                names[pos].append(name)
+
+
+def _acquire_tracing(nframe: int) -> None:
+    """Start tracemalloc for the first active tracker unless already tracing."""
+    import tracemalloc
+
+    global _tracking_users, _tracking_started
+    with _TRACKING_LOCK:
+        if _tracking_users == 0 and not tracemalloc.is_tracing():
+            tracemalloc.start(nframe)
+            _tracking_started = True
+        elif (limit := tracemalloc.get_traceback_limit()) < nframe:
+            # restarting would discard the traces an outer tracker depends on
+            raise RuntimeError(
+                f"tracemalloc is already tracing with {limit} frames; {nframe=!r} "
+                "needs tracing started with at least as many"
+            )
+        _tracking_users += 1
+
+
+def _release_tracing() -> None:
+    """Stop tracemalloc when the last active tracker exits, if trackers started it."""
+    import tracemalloc
+
+    global _tracking_users, _tracking_started
+    with _TRACKING_LOCK:
+        _tracking_users -= 1
+        if _tracking_users == 0 and _tracking_started:
+            tracemalloc.stop()
+            _tracking_started = False
+
+
+def _module_for_file(filename: str) -> str:
+    """Return the name of the imported module loaded from the given file."""
+    name = _FILE_MODULES.get(filename)
+    if name is None:
+        if len(_FILE_MODULES) >= _FILE_MODULES_MAXSIZE:
+            _FILE_MODULES.clear()
+        for module_name, module in list(sys.modules.items()):
+            module_file = getattr(module, "__file__", None)
+            if module_file is not None:
+                _FILE_MODULES.setdefault(module_file, module_name)
+        # not cached: the module may be imported later
+        name = _FILE_MODULES.get(filename, "<unknown>")
+    return name
+
+
+def _function_for_line(filename: str, lineno: int) -> str:
+    """Return the qualified name of the innermost def enclosing the source line."""
+    scopes = _SOURCE_SCOPES.get(filename)
+    if scopes is None:
+        if len(_SOURCE_SCOPES) >= _SOURCE_SCOPES_MAXSIZE:
+            _SOURCE_SCOPES.clear()
+        scopes = _SOURCE_SCOPES[filename] = _source_scopes(filename)
+    qualname = "<module>"
+    for first, last, name in scopes:
+        if first <= lineno <= last:
+            qualname = name
+    return qualname
+
+
+def _source_scopes(filename: str) -> list[tuple[int, int, str]]:
+    """Return the line span and qualname of each def and class in a source file."""
+    import ast
+    import linecache
+
+    try:
+        tree = ast.parse("".join(linecache.getlines(filename)))
+    except (SyntaxError, ValueError):
+        return []
+
+    scopes: list[tuple[int, int, str]] = []
+
+    def visit(node: ast.AST, prefix: str) -> None:
+        for child in ast.iter_child_nodes(node):
+            if isinstance(child, ast.FunctionDef | ast.AsyncFunctionDef):
+                qualname = f"{prefix}{child.name}"
+                scopes.append((child.lineno, child.end_lineno or 0, qualname))
+                visit(child, f"{qualname}.<locals>.")
+            elif isinstance(child, ast.ClassDef):
+                qualname = f"{prefix}{child.name}"
+                scopes.append((child.lineno, child.end_lineno or 0, qualname))
+                visit(child, f"{qualname}.")
+            else:
+                visit(child, prefix)
+
+    visit(tree, "")
+    return scopes
+
+
+def _code_info(frame: FrameType) -> tuple[str, str, str, str]:
+    """Return the cached static details of the frame's code object."""
+    code = frame.f_code
+    # single get and set operations keep the cache consistent without a lock, also
+    # on free-threaded builds; concurrent misses merely compute the same entry twice
+    entry = _CODE_INFO.get(id(code))
+    if entry is not None and entry[0] is code:
+        return entry[1]
+
+    if len(_CODE_INFO) >= _CODE_INFO_MAXSIZE:
+        _CODE_INFO.clear()
+    module = frame.f_globals.get("__name__", "<unknown>")
+    info = (module, code.co_name, code.co_qualname, code.co_filename)
+    _CODE_INFO[id(code)] = (code, info)
+    return info
@@ -0,0 +1,123 @@
+"""Opt-in counters for the work done by purekit functions.
+
+Instrumented functions look up the active collector once per call and skip all
+counting when there is none. Collectors are bound to the current context, so they
+apply per thread and per asyncio task.
+
+Example:
+>>> import purekit as pk
+>>> with pk.stats.collect() as collector:
+...     items = list(pk.core.flatten([1, [2, [3]]]))
+>>> snapshot = collector.snapshot()
+>>> snapshot["core.flatten.calls"], snapshot["core.flatten.items"]
+(1, 5)
+>>> snapshot["core.flatten.max_depth"]
+2
+"""
+
+__all__ = ("Collector", "collect", "current")
+
+import time
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Any
+
+
+class Collector:
+    """Thread-safe accumulator of named counters and timings."""
+
+    def __init__(self) -> None:
+        # imported here so that importing the module stays cheap on the CLI path
+        import threading
+
+        self._counters: dict[str, int | float] = {}
+        self._lock = threading.Lock()
+
+    def add(self, counters: dict[str, int | float]) -> None:
+        """Add each value to its counter."""
+        with self._lock:
+            for name, value in counters.items():
+                self._counters[name] = self._counters.get(name, 0) + value
+
+    def maximum(self, name: str, value: int | float) -> None:
+        """Raise the counter to value if value is larger."""
+        with self._lock:
+            if name not in self._counters or value > self._counters[name]:
+                self._counters[name] = value
+
+    def snapshot(self) -> dict[str, int | float]:
+        """Return a copy of all counters, sorted by name."""
+        with self._lock:
+            return dict(sorted(self._counters.items()))
+
+    def reset(self) -> None:
+        """Discard all counters."""
+        with self._lock:
+            self._counters.clear()
+
+
+_COLLECTOR: ContextVar[Collector | None] = ContextVar("purekit.stats", default=None)
+
+
+@contextmanager
+def collect(collector: Collector | None = None) -> Iterator[Collector]:
+    """Activate a collector, a new one by default, for the current context."""
+    if collector is None:
+        collector = Collector()
+    token = _COLLECTOR.set(collector)
+    try:
+        yield collector
+    finally:
+        _COLLECTOR.reset(token)
+
+
+def current() -> Collector | None:
+    """Return the collector active in the current context, if any."""
+    return _COLLECTOR.get()
+
+
+def _observe(
+    collector: Collector,
+    prefix: str,
+    items: Iterable,
+    process: Callable[[Iterable], Iterator],
+    inputs: str,
+    outputs: str,
+    weigh: "Callable[[Any], int] | None" = None,
+) -> Iterator:
+    """Yield from process(items), counting inputs consumed and outputs produced.
+
+    Each output counts as ``weigh(output)`` if given, else as 1. The time recorded
+    under ``{prefix}.seconds`` excludes the time spent suspended at a yield, i.e. in
+    the consumer.
+    """
+    consumed = 0
+
+    def tally() -> Iterator:
+        nonlocal consumed
+        for item in items:
+            consumed += 1
+            yield item
+
+    produced = 0
+    paused = 0.0
+    start = time.perf_counter()
+    try:
+        for result in process(tally()):
+            produced += 1 if weigh is None else weigh(result)
+            suspended = time.perf_counter()
+            yield result
+            paused += time.perf_counter() - suspended
+    finally:
+        collector.add(
+            {
+                f"{prefix}.calls": 1,
+                f"{prefix}.{inputs}": consumed,
+                f"{prefix}.{outputs}": produced,
+                f"{prefix}.seconds": time.perf_counter() - start - paused,
+            }
+        )
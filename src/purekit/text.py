@@ -2,10 +2,27 @@ __all__ = ("char_diff", "concat", "findall", "headline", "numstr", "remove_punct
 
 import itertools
 import re
-from collections.abc import Iterable, Iterator
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
 
 import purekit as pk
 
+# avoid importing typing at startup; type checkers treat this name as typing's,
+# and the typing import comes last so that linters resolve overload to it too
+TYPE_CHECKING = False
+if not TYPE_CHECKING:
+
+    def overload(func: Callable) -> Callable:
+        return func
+
+else:
+    from typing import overload
+
+
+BytesLike = bytes | bytearray | memoryview
+
+_BYTES_TYPES = (bytes, bytearray, memoryview)
+
 
 def char_diff(string1: str, string2: str, /) -> str:
     """Return a three-line string highlighting character differences with '|'."""
@@ -18,33 +35,145 @@ def char_diff(string1: str, string2: str, /) -> str:
     return "\n".join((string1, markers, string2))
 
 
-def concat(*strings: str | Iterable[str | None] | None, sep: str = " ") -> str:
-    """Return concatenated string excluding None values."""
+@overload
+def concat(
+    *strings: str | BytesLike | Iterable[str | BytesLike | None] | None,
+    sep: str = " ",
+) -> str: ...
+@overload
+def concat(
+    *strings: str | BytesLike | Iterable[str | BytesLike | None] | None,
+    sep: BytesLike,
+) -> bytearray: ...
+def concat(
+    *strings: str | BytesLike | Iterable[str | BytesLike | None] | None,
+    sep: str | BytesLike = " ",
+) -> str | bytearray:
+    """Return concatenated string excluding None values.
+
+    With a bytes-like `sep` the result is a bytearray: bytes-like items are joined
+    without intermediate copies and other items are UTF-8 encoded. With a str `sep`
+    a memoryview item raises TypeError, as its str() is a memory address.
+    """
+    if isinstance(sep, _BYTES_TYPES):
+        return bytearray(sep).join(
+            item if isinstance(item, _BYTES_TYPES) else str(item).encode()
+            for item in pk.core.flatten(strings, atomic_types=(str, *_BYTES_TYPES))
+            if item is not None
+        )
+
     return sep.join(
-        item if isinstance(item, str) else str(item)
-        for item in pk.core.flatten(strings)
+        item if isinstance(item, str) else _str_item(item)
+        for item in pk.core.flatten(strings, atomic_types=(str, *_BYTES_TYPES))
         if item is not None
     )
 
 
+@overload
 def findall(
     strings: Iterable[str],
-    pattern: str | re.Pattern,
+    pattern: str | re.Pattern[str],
     flags: int = re.IGNORECASE,
-) -> Iterator[list[str]]:
-    """Return an iterator of lists with regex matches for each string."""
+    *,
+    workers: int | None = None,
+    chunksize: int = 1024,
+) -> Iterator[list[str]]: ...
+@overload
+def findall(
+    strings: Iterable[BytesLike],
+    pattern: bytes | re.Pattern[bytes],
+    flags: int = re.IGNORECASE,
+    *,
+    workers: int | None = None,
+    chunksize: int = 1024,
+) -> Iterator[list[bytes]]: ...
+def findall(
+    strings: Iterable[str] | Iterable[BytesLike],
+    pattern: str | bytes | re.Pattern,
+    flags: int = re.IGNORECASE,
+    *,
+    workers: int | None = None,
+    chunksize: int = 1024,
+) -> Iterator[list[str]] | Iterator[list[bytes]]:
+    """Return an iterator of lists with regex matches for each string.
+
+    Bytes-like strings, including memoryview slices, need a bytes pattern and are
+    searched in place; only the matches are copied out. With `workers`, chunks of
+    `chunksize` strings are matched in a thread pool while preserving input order.
+    """
     regex = pattern if isinstance(pattern, re.Pattern) else re.compile(pattern, flags)
+    collector = pk.stats.current()
+    if collector is not None:
+        collector.add({"text.findall.regex_compiles": int(regex is not pattern)})
+        yield from pk.stats._observe(
+            collector,
+            "text.findall",
+            strings,
+            lambda lines: _findall(lines, regex, workers, chunksize),
+            inputs="lines_scanned",
+            outputs="matches",
+            weigh=len,
+        )
+        return
+
+    if workers is not None:
+        yield from _findall(strings, regex, workers, chunksize)
+        return
+
     for next_string in strings:
         yield regex.findall(next_string)
 
 
+@overload
 def grep(
     strings: Iterable[str],
-    pattern: str | re.Pattern,
+    pattern: str | re.Pattern[str],
     flags: int = re.IGNORECASE,
-) -> Iterator[str]:
-    """Return an iterator of strings that match the regex."""
+    *,
+    workers: int | None = None,
+    chunksize: int = 1024,
+) -> Iterator[str]: ...
+@overload
+def grep(
+    strings: Iterable[BytesLike],
+    pattern: bytes | re.Pattern[bytes],
+    flags: int = re.IGNORECASE,
+    *,
+    workers: int | None = None,
+    chunksize: int = 1024,
+) -> Iterator[BytesLike]: ...
+def grep(
+    strings: Iterable[str] | Iterable[BytesLike],
+    pattern: str | bytes | re.Pattern,
+    flags: int = re.IGNORECASE,
+    *,
+    workers: int | None = None,
+    chunksize: int = 1024,
+) -> Iterator[str] | Iterator[BytesLike]:
+    """Return an iterator of strings that match the regex.
+
+    Bytes-like strings, including memoryview slices, need a bytes pattern and are
+    yielded as given, without copies. With `workers`, chunks of `chunksize` strings
+    are matched in a thread pool while preserving input order.
+    """
     regex = pattern if isinstance(pattern, re.Pattern) else re.compile(pattern, flags)
+    collector = pk.stats.current()
+    if collector is not None:
+        collector.add({"text.grep.regex_compiles": int(regex is not pattern)})
+        yield from pk.stats._observe(
+            collector,
+            "text.grep",
+            strings,
+            lambda lines: _grep(lines, regex, workers, chunksize),
+            inputs="lines_scanned",
+            outputs="lines_matched",
+        )
+        return
+
+    if workers is not None:
+        yield from _grep(strings, regex, workers, chunksize)
+        return
+
     for next_string in strings:
         if regex.search(next_string):
             yield next_string
@@ -74,8 +203,94 @@ def numstr(value: int | float, /) -> str:
     return f"{sign}{integer_str}{fraction_str}"
 
 
-def remove_punctuation(input_string: str, /) -> str:
-    """Return the input string with all punctuation characters removed."""
+@overload
+def remove_punctuation(input_string: str, /) -> str: ...
+@overload
+def remove_punctuation(input_string: bytearray, /) -> bytearray: ...
+@overload
+def remove_punctuation(input_string: bytes | memoryview, /) -> bytes: ...
+def remove_punctuation(input_string: str | BytesLike, /) -> str | bytes | bytearray:
+    """Return the input string with all punctuation characters removed.
+
+    Bytes and bytearray inputs keep their type and lose ASCII punctuation, which
+    never occurs inside multi-byte UTF-8 sequences; a memoryview yields bytes.
+    """
     from string import punctuation
 
-    return input_string.translate(str.maketrans("", "", punctuation))
+    if isinstance(input_string, str):
+        return input_string.translate(str.maketrans("", "", punctuation))
+    if isinstance(input_string, memoryview):
+        # copying and translating in C beats a zero-copy regex substitution by far
+        input_string = input_string.tobytes()
+    return input_string.translate(None, punctuation.encode())
+
+
+def _findall(
+    strings: Iterable[str],
+    regex: re.Pattern,
+    workers: int | None,
+    chunksize: int,
+) -> Iterator[list[str]]:
+    if workers is not None:
+
+        def find_chunk(chunk: list[str]) -> list[list[str]]:
+            return [regex.findall(string) for string in chunk]
+
+        yield from _threaded(find_chunk, strings, workers, chunksize)
+        return
+
+    for next_string in strings:
+        yield regex.findall(next_string)
+
+
+def _grep(
+    strings: Iterable[str],
+    regex: re.Pattern,
+    workers: int | None,
+    chunksize: int,
+) -> Iterator[str]:
+    if workers is not None:
+
+        def grep_chunk(chunk: list[str]) -> list[str]:
+            return [string for string in chunk if regex.search(string)]
+
+        yield from _threaded(grep_chunk, strings, workers, chunksize)
+        return
+
+    for next_string in strings:
+        if regex.search(next_string):
+            yield next_string
+
+
+def _str_item(item: object) -> str:
+    """Return the str form of a non-str item joined by concat with a str sep."""
+    if isinstance(item, memoryview):
+        raise TypeError("memoryview items need a bytes-like sep")
+    return str(item)
+
+
+def _threaded(
+    func: Callable[[list], list],
+    items: Iterable,
+    workers: int,
+    chunksize: int,
+) -> Iterator:
+    """Return an iterator over func applied to chunks of items in a thread pool."""
+    if workers < 1:
+        raise ValueError(f"invalid {workers=!r}; expected >= 1")
+    if chunksize < 1:
+        raise ValueError(f"invalid {chunksize=!r}; expected >= 1")
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    iterator = iter(items)
+    chunks = iter(lambda: list(itertools.islice(iterator, chunksize)), [])
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        # keep a bounded window of chunks in flight so inputs are consumed lazily
+        window = itertools.islice(chunks, 2 * workers)
+        pending = deque(executor.submit(func, chunk) for chunk in window)
+        while pending:
+            results = pending.popleft().result()
+            for chunk in itertools.islice(chunks, 1):
+                pending.append(executor.submit(func, chunk))
+            yield from results
@@ -0,0 +1,141 @@
+import json
+import math
+import sys
+import sysconfig
+from pathlib import Path
+
+import pytest
+
+import purekit as pk
+from purekit.bench.__main__ import main
+
+
+def results(**benchmarks: list[float]) -> dict:
+    return {
+        "benchmarks": {
+            name: {"samples": samples, "mean": sum(samples) / len(samples)}
+            for name, samples in benchmarks.items()
+        }
+    }
+
+
+class TestMeasure:
+    def test_returns_calibrated_samples(self):
+        result = pk.bench.measure(lambda: None, repeat=3, min_time=0.001)
+        assert result["number"] > 1
+        assert len(result["samples"]) == 3
+        assert result["min"] <= result["mean"]
+        assert result["stdev"] >= 0
+
+    def test_invalid_repeat_raises_value_error(self):
+        with pytest.raises(ValueError) as excinfo:
+            pk.bench.measure(lambda: None, repeat=1)
+        assert str(excinfo.value) == "invalid repeat=1; expected >= 2"
+
+
+class TestRun:
+    def test_filters_by_pattern(self):
+        result = pk.bench.run("meta.caller_info*", repeat=2, min_time=0.001)
+        assert list(result["benchmarks"]) == ["meta.caller_info[1k-calls]"]
+        assert result["purekit"] == pk.__version__
+        json.dumps(result)
+
+    @pytest.mark.parametrize("name", list(pk.bench.WORKLOADS))
+    def test_workloads_run(self, name: str):
+        pk.bench.WORKLOADS[name]()()
+
+
+class TestGilEnabled:
+    def test_matches_build(self):
+        if sysconfig.get_config_var("Py_GIL_DISABLED"):
+            assert pk.bench.gil_enabled() == sys._is_gil_enabled()
+        else:
+            assert pk.bench.gil_enabled() is True
+
+    @pytest.mark.parametrize("enabled", [True, False])
+    def test_uses_runtime_flag(self, monkeypatch: pytest.MonkeyPatch, enabled: bool):
+        monkeypatch.setattr(sys, "_is_gil_enabled", lambda: enabled, raising=False)
+        assert pk.bench.gil_enabled() is enabled
+
+
+class TestScaling:
+    def test_reports_speedup_per_thread_count(self):
+        result = pk.bench.scaling("meta.caller_info*", threads=(1, 2), repeat=1)
+        (name,) = result["benchmarks"]
+        assert name == "meta.caller_info[1k-calls]"
+        speedup = result["benchmarks"][name]["speedup"]
+        assert list(speedup) == ["1", "2"]
+        assert speedup["1"] == 1.0
+        assert result["gil_enabled"] == pk.bench.gil_enabled()
+        json.dumps(result)
+
+    @pytest.mark.parametrize("threads", [(), (0, 1)])
+    def test_invalid_threads_raise_value_error(self, threads: tuple[int, ...]):
+        with pytest.raises(ValueError):
+            pk.bench.scaling(threads=threads)
+
+
+class TestCompare:
+    def test_verdicts(self):
+        old = results(
+            slow=[1.0, 1.01, 0.99, 1.0],
+            fast=[1.0, 1.01, 0.99, 1.0],
+            noisy=[1.0, 2.0, 0.5, 1.5],
+            tiny=[1.0, 1.01, 0.99, 1.0],
+            dropped=[1.0, 1.0, 1.0, 1.0],
+        )
+        new = results(
+            slow=[1.5, 1.51, 1.49, 1.5],
+            fast=[0.5, 0.51, 0.49, 0.5],
+            noisy=[1.5, 2.5, 1.0, 2.0],
+            tiny=[1.02, 1.03, 1.01, 1.02],
+            added=[1.0, 1.0, 1.0, 1.0],
+        )
+        verdicts = {item.name: item.verdict for item in pk.bench.compare(old, new)}
+        assert verdicts == {
+            "slow": "slower",
+            "fast": "faster",
+            "noisy": "same",
+            "tiny": "same",
+        }
+
+    def test_zero_variance_change_is_infinitely_significant(self):
+        old, new = results(x=[1.0, 1.0]), results(x=[2.0, 2.0])
+        (item,) = pk.bench.compare(old, new)
+        assert item.ratio == 2.0
+        assert item.t_stat == math.inf
+        assert item.verdict == "slower"
+
+
+class TestMain:
+    def write(self, path: Path, data: dict) -> Path:
+        path.write_text(json.dumps(data), encoding="utf-8")
+        return path
+
+    def test_compare_exit_status(self, tmp_path: Path, capsys):
+        old = self.write(tmp_path / "old.json", results(x=[1.0, 1.01, 0.99]))
+        new = self.write(tmp_path / "new.json", results(x=[2.0, 2.01, 1.99]))
+        assert main(["compare", str(old), str(new)]) == 1
+        assert main(["compare", str(new), str(old)]) == 0
+        assert "slower" in capsys.readouterr().out
+
+    def test_run_writes_json(self, tmp_path: Path):
+        output = tmp_path / "results.json"
+        argv = ["run", "-k", "meta.caller_info*", "--repeat", "2", "--min-time", "0"]
+        assert main([*argv, "-o", str(output)]) == 0
+        data = json.loads(output.read_text(encoding="utf-8"))
+        assert list(data["benchmarks"]) == ["meta.caller_info[1k-calls]"]
+
+    def test_scaling_writes_json(self, tmp_path: Path):
+        output = tmp_path / "scaling.json"
+        argv = ["scaling", "-k", "meta.caller_info*", "--threads", "1,2"]
+        assert main([*argv, "--repeat", "1", "-o", str(output)]) == 0
+        data = json.loads(output.read_text(encoding="utf-8"))
+        assert data["threads"] == [1, 2]
+
+    def test_run_without_matches(self):
+        assert main(["run", "-k", "no-such-benchmark"]) == 2
+
+    def test_list(self, capsys):
+        assert main(["list"]) == 0
+        assert capsys.readouterr().out.split("\n")[:-1] == list(pk.bench.WORKLOADS)
@@ -0,0 +1,212 @@
+import argparse
+import io
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from purekit import __main__ as cli
+
+LOG = b"Hello, World!\nfoo bar\nERROR: x=1 y=22\nlast line without newline"
+
+
+def run(command: str, data: bytes = LOG, **kwargs) -> bytes:
+    args = argparse.Namespace(command=command, **kwargs)
+    chunks: list[bytes] = []
+    cli.COMMANDS[command](args, io.BytesIO(data), chunks.append)
+    return b"".join(chunks)
+
+
+def purekit(
+    *argv: str, stdin: bytes = b"", tmpdir: Path | None = None
+) -> subprocess.CompletedProcess:
+    env = None if tmpdir is None else {**os.environ, "TMPDIR": str(tmpdir)}
+    return subprocess.run(
+        [sys.executable, "-m", "purekit", *argv],
+        input=stdin,
+        capture_output=True,
+        env=env,
+    )
+
+
+class TestReadLines:
+    def test_lines_across_block_boundaries(self, monkeypatch):
+        monkeypatch.setattr(cli, "BLOCK_SIZE", 4)
+        blocks = list(cli.read_lines(io.BytesIO(b"ab\ncdefg\nh\n\ni")))
+        lines = [line for block in blocks for line in block]
+        assert lines == [b"ab\n", b"cdefg\n", b"h\n", b"\n", b"i\n"]
+
+    def test_splits_on_newline_only(self):
+        blocks = list(cli.read_lines(io.BytesIO(b"foo\rbar\r\nbaz\n")))
+        assert blocks == [[b"foo\rbar\r\n", b"baz\n"]]
+
+    def test_long_line_spanning_many_blocks(self, monkeypatch):
+        monkeypatch.setattr(cli, "BLOCK_SIZE", 4)
+        data = b"x" * 30 + b"\nab\n" + b"y" * 9
+        blocks = list(cli.read_lines(io.BytesIO(data)))
+        lines = [line for block in blocks for line in block]
+        assert lines == [b"x" * 30 + b"\n", b"ab\n", b"y" * 9 + b"\n"]
+
+    def test_empty_input(self):
+        assert list(cli.read_lines(io.BytesIO(b""))) == []
+
+
+class TestReadJson:
+    def test_documents_across_block_boundaries(self, monkeypatch):
+        monkeypatch.setattr(cli, "BLOCK_SIZE", 3)
+        data = '{"k": "caf\u00e9 \u00fc"}\n12345 [1.5e3, true]\nnull 7'.encode()
+        documents = list(cli.read_json(io.BytesIO(data)))
+        assert documents == [["caf\u00e9 \u00fc"], 12345, [1500.0, True], None, 7]
+
+    def test_document_spanning_many_blocks(self, monkeypatch):
+        monkeypatch.setattr(cli, "BLOCK_SIZE", 4)
+        data = json.dumps([list(range(50)), {"a": "x" * 40}]).encode() + b"\n[]"
+        documents = list(cli.read_json(io.BytesIO(data)))
+        assert documents == [[list(range(50)), ["x" * 40]], []]
+
+    def test_truncated_document_raises(self, monkeypatch):
+        monkeypatch.setattr(cli, "BLOCK_SIZE", 4)
+        with pytest.raises(ValueError):
+            list(cli.read_json(io.BytesIO(b'[1] {"a": [1, 2')))
+
+    def test_empty_input(self):
+        assert list(cli.read_json(io.BytesIO(b" \n"))) == []
+
+
+class TestCommands:
+    def test_grep_ignores_case_by_default(self):
+        result = run("grep", pattern="error|world", case_sensitive=False)
+        assert result == b"Hello, World!\nERROR: x=1 y=22\n"
+
+    def test_grep_case_sensitive(self):
+        result = run("grep", pattern="error|World", case_sensitive=True)
+        assert result == b"Hello, World!\n"
+
+    def test_grep_keeps_carriage_returns_in_line(self):
+        result = run("grep", b"foo\rbar\nbaz\n", pattern="bar", case_sensitive=False)
+        assert result == b"foo\rbar\n"
+
+    def test_grep_last_line_gets_newline(self):
+        result = run("grep", pattern="without", case_sensitive=False)
+        assert result == b"last line without newline\n"
+
+    def test_findall_matches_one_per_line(self):
+        result = run("findall", pattern=r"\d+", case_sensitive=False)
+        assert result == b"1\n22\n"
+
+    def test_findall_groups_are_tab_separated(self):
+        result = run("findall", pattern=r"(\w)=(\d+)", case_sensitive=False)
+        assert result == b"x\t1\ny\t22\n"
+
+    def test_flatten_json_leaves(self):
+        data = b'{"a": [1, {"b": "x", "c": [2, 3]}], "d": null}'
+        assert run("flatten", data, max_depth=None) == b'1\n"x"\n2\n3\nnull\n'
+
+    def test_flatten_max_depth(self):
+        data = b"[1, [2, [3]]]"
+        assert run("flatten", data, max_depth=1) == b"1\n2\n[3]\n"
+
+    def test_flatten_json_stream(self):
+        data = b'{"a": 1}\n{"b": [2, 3]}\n  [4] "x"\n'
+        assert run("flatten", data, max_depth=None) == b'1\n2\n3\n4\n"x"\n'
+
+    def test_flatten_empty_input(self):
+        assert run("flatten", b" \n", max_depth=None) == b""
+
+    def test_normalize_removes_ascii_punctuation(self):
+        data = "Grüße, Welt! (café)".encode()
+        assert run("normalize", data) == "Grüße Welt café".encode()
+
+
+class TestMain:
+    def test_reads_stdin(self):
+        result = purekit("grep", "foo", stdin=LOG)
+        assert result.returncode == 0
+        assert result.stdout == b"foo bar\n"
+
+    def test_workers_keep_file_order(self, tmp_path: Path):
+        paths = []
+        for i in range(4):
+            path = tmp_path / f"{i}.txt"
+            path.write_bytes(f"line {i}\nskip\n".encode())
+            paths.append(str(path))
+        result = purekit("grep", "--workers", "2", "line", *paths)
+        assert result.returncode == 0
+        assert result.stdout == b"line 0\nline 1\nline 2\nline 3\n"
+
+    def test_workers_stream_large_output_and_remove_spools(self, tmp_path: Path):
+        spool_dir = tmp_path / "spool"
+        spool_dir.mkdir()
+        paths = []
+        for i in range(9):
+            path = tmp_path / f"{i}.txt"
+            path.write_bytes(f"{i}\n".encode() * 300_000)
+            paths.append(str(path))
+        result = purekit("grep", "-w", "2", ".", *paths, tmpdir=spool_dir)
+        assert result.returncode == 0
+        expected = b"".join(f"{i}\n".encode() * 300_000 for i in range(9))
+        assert result.stdout == expected
+        assert list(spool_dir.iterdir()) == []
+
+    def test_workers_stop_on_closed_pipe(self, tmp_path: Path):
+        spool_dir = tmp_path / "spool"
+        spool_dir.mkdir()
+        paths = []
+        for i in range(6):
+            path = tmp_path / f"{i}.txt"
+            path.write_bytes(b"line\n" * 500_000)
+            paths.append(str(path))
+        process = subprocess.Popen(
+            [sys.executable, "-m", "purekit", "grep", "-w", "2", "line", *paths],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            env={**os.environ, "TMPDIR": str(spool_dir)},
+        )
+        assert process.stdout.read(5) == b"line\n"
+        process.stdout.close()
+        stderr = process.stderr.read()
+        process.stderr.close()
+        assert process.wait() == 0
+        assert stderr == b""
+        assert list(spool_dir.iterdir()) == []
+
+    def test_flatten_file(self, tmp_path: Path):
+        path = tmp_path / "data.json"
+        path.write_text(json.dumps({"a": [1, 2]}), encoding="utf-8")
+        assert purekit("flatten", str(path)).stdout == b"1\n2\n"
+
+    def test_flatten_ndjson_stdin(self):
+        result = purekit("flatten", stdin=b'{"a":1}\n{"b":2}\n')
+        assert result.returncode == 0
+        assert result.stdout == b"1\n2\n"
+
+    def test_missing_file_exit_status(self, tmp_path: Path):
+        result = purekit("normalize", str(tmp_path / "missing.txt"))
+        assert result.returncode == 2
+        assert b"purekit: error:" in result.stderr
+
+    def test_invalid_pattern_exit_status(self):
+        result = purekit("grep", "(", stdin=LOG)
+        assert result.returncode == 2
+        assert result.stderr.startswith(b"purekit: error:")
+
+    def test_malformed_json_exit_status(self, tmp_path: Path):
+        paths = []
+        for i, text in enumerate(["[1]", "{not json"]):
+            path = tmp_path / f"{i}.json"
+            path.write_text(text, encoding="utf-8")
+            paths.append(str(path))
+        spool_dir = tmp_path / "spool"
+        spool_dir.mkdir()
+        result = purekit("flatten", "--workers", "2", *paths, tmpdir=spool_dir)
+        assert result.returncode == 2
+        assert result.stderr.startswith(b"purekit: error:")
+        assert list(spool_dir.iterdir()) == []
+
+    @pytest.mark.parametrize("workers", ["0", "-1"])
+    def test_invalid_workers(self, workers: str):
+        result = purekit("normalize", "--workers", workers)
+        assert result.returncode == 2
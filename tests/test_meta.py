@@ -1,7 +1,14 @@
+import sys
+import threading
+import time
+import tracemalloc
+
 import pytest
 
 import purekit as pk
 
+GLOBAL_TARGET = object()
+
 
 class TestGetCallerModule:
     def test_immediate_caller_returns_module_name(self):
@@ -113,3 +120,397 @@ class TestGetCallerVarname:
 
         with pytest.raises(ValueError):
             caller()
+
+
+class TestCallerInfo:
+    def test_immediate_caller_details(self):
+        def foobar():
+            return pk.meta.caller_info(), sys._getframe().f_lineno
+
+        info, lineno = foobar()
+        assert info.module == __name__
+        assert info.function == "foobar"
+        assert info.qualname.endswith("test_immediate_caller_details.<locals>.foobar")
+        assert info.filename == __file__
+        assert info.lineno == lineno
+
+    def test_depth_two_returns_outer_details(self):
+        def outer():
+            def inner():
+                return pk.meta.caller_info(depth=2)
+
+            return inner()
+
+        info = outer()
+        assert info.module == __name__
+        assert info.function == "outer"
+        assert info.qualname.endswith("<locals>.outer")
+
+    def test_agrees_with_single_purpose_helpers(self):
+        def caller():
+            info = pk.meta.caller_info()
+            module = pk.meta.get_caller_module()
+            name = pk.meta.get_caller_name()
+            return info, module, name
+
+        info, module, name = caller()
+        assert (info.module, info.function) == (module, name)
+
+    def test_repeated_calls_reuse_cached_code_details(self):
+        def caller():
+            return pk.meta.caller_info()
+
+        first, second = caller(), caller()
+        assert first is second
+        assert pk.meta._CALLER_INFO[id(caller.__code__)][0] is caller.__code__
+
+    def test_call_sites_in_one_function_report_their_own_line(self):
+        def caller():
+            first = pk.meta.caller_info()
+            second = pk.meta.caller_info()
+            return first, second
+
+        first, second = caller()
+        assert second.lineno == first.lineno + 1
+
+    def test_equal_code_from_other_files_is_not_conflated(self):
+        namespace = {"__name__": "generated", "caller_info": pk.meta.caller_info}
+        codes = [compile("caller_info()", f"<code-{i}>", "eval") for i in range(2)]
+        assert codes[0] == codes[1]
+        filenames = [eval(code, namespace).filename for code in codes]
+        assert filenames == ["<code-0>", "<code-1>"]
+
+    def test_same_code_under_other_globals_reports_their_module(self):
+        code = compile("caller_info()", "<code>", "eval")
+        modules = [
+            eval(code, {"__name__": name, "caller_info": pk.meta.caller_info}).module
+            for name in ("m1", "m2", "m1")
+        ]
+        assert modules == ["m1", "m2", "m1"]
+
+    @pytest.mark.parametrize("depth", [0, -1])
+    def test_invalid_depth_raises_value_error(self, depth: int):
+        expected = f"invalid {depth=!r}; expected >= 1"
+        with pytest.raises(ValueError) as excinfo:
+            pk.meta.caller_info(depth)
+        assert str(excinfo.value) == expected
+
+    def test_too_large_depth_raises_runtime_error(self):
+        def caller():
+            with pytest.raises(RuntimeError) as excinfo:
+                pk.meta.caller_info(depth=9999)
+            assert str(excinfo.value) == "expected to be executed within a function"
+
+        caller()
+
+
+class TestGetCallerVarnames:
+    def test_resolves_many_targets_in_argument_order(self):
+        def caller():
+            foo = object()
+            bar = object()
+            return pk.meta.get_caller_varnames(bar, foo), foo, bar
+
+        names, *_ = caller()
+        assert names == [["bar"], ["foo"]]
+
+    def test_object_bound_to_several_names(self):
+        def caller():
+            foo = object()
+            alias = foo
+            return pk.meta.get_caller_varnames(foo), alias
+
+        names, _ = caller()
+        assert names == [["foo", "alias"]]
+
+    def test_repeated_target_gets_names_at_each_position(self):
+        def caller():
+            foo = object()
+            return pk.meta.get_caller_varnames(foo, foo)
+
+        assert caller() == [["foo"], ["foo"]]
+
+    def test_closure_cell_is_resolved(self):
+        captured = object()
+
+        def caller():
+            return pk.meta.get_caller_varnames(captured)
+
+        assert caller() == [["captured"]]
+
+    def test_falls_back_to_globals(self):
+        def caller():
+            return pk.meta.get_caller_varnames(GLOBAL_TARGET)
+
+        assert caller() == [["GLOBAL_TARGET"]]
+
+    def test_locals_take_precedence_over_globals(self):
+        def caller():
+            local_alias = GLOBAL_TARGET
+            return pk.meta.get_caller_varnames(local_alias)
+
+        assert caller() == [["local_alias"]]
+
+    def test_unbound_target_maps_to_empty_list(self):
+        def caller():
+            return pk.meta.get_caller_varnames(object())
+
+        assert caller() == [[]]
+
+    def test_no_targets(self):
+        assert pk.meta.get_caller_varnames() == []
+
+    def test_depth_two_inspects_outer_frame(self):
+        def outer():
+            outer_value = object()
+
+            def inner():
+                return pk.meta.get_caller_varnames(outer_value, depth=2)
+
+            return inner()
+
+        assert outer() == [["outer_value"]]
+
+    @pytest.mark.parametrize("depth", [0, -1])
+    def test_invalid_depth_raises_value_error(self, depth: int):
+        expected = f"invalid {depth=!r}; expected >= 1"
+        with pytest.raises(ValueError) as excinfo:
+            pk.meta.get_caller_varnames(object(), depth=depth)
+        assert str(excinfo.value) == expected
+
+
+def _wait_for(event: threading.Event) -> None:
+    event.wait(timeout=10)
+
+
+class TestSampler:
+    def test_sample_records_other_thread_stacks(self):
+        release = threading.Event()
+        worker = threading.Thread(target=_wait_for, args=(release,))
+        worker.start()
+        try:
+            sampler = pk.meta.Sampler()
+            sampler.sample()
+        finally:
+            release.set()
+            worker.join()
+
+        assert sampler.samples == 1
+        stacks = sampler.counts()
+        assert any(f"{__name__}:_wait_for" in stack for stack in stacks)
+        assert all(
+            "test_sample_records_other_thread_stacks" not in ";".join(stack)
+            for stack in stacks
+        )
+
+    def test_collapsed_stack_format(self):
+        sampler = pk.meta.Sampler()
+        sampler._counts.update({("mod:outer", "mod:inner"): 3, ("mod:outer",): 1})
+        assert sampler.collapsed() == "mod:outer 1\nmod:outer;mod:inner 3"
+
+    def test_max_depth_keeps_innermost_frames(self):
+        release = threading.Event()
+        worker = threading.Thread(target=_wait_for, args=(release,))
+        worker.start()
+        try:
+            sampler = pk.meta.Sampler(max_depth=1)
+            sampler.sample()
+        finally:
+            release.set()
+            worker.join()
+
+        assert all(len(stack) == 1 for stack in sampler.counts())
+
+    def test_background_sampling(self):
+        with pk.meta.Sampler(interval=0.001) as sampler:
+            assert sampler.running
+            deadline = time.monotonic() + 10
+            while sampler.samples < 3 and time.monotonic() < deadline:
+                time.sleep(0.001)
+
+        assert not sampler.running
+        assert sampler.samples >= 3
+        assert any(
+            f"{__name__}:TestSampler.test_background_sampling" in stack
+            for stack in sampler.counts()
+        )
+
+    def test_clear_discards_samples(self):
+        sampler = pk.meta.Sampler()
+        sampler.sample()
+        sampler.clear()
+        assert sampler.samples == 0
+        assert sampler.counts() == {}
+
+    def test_start_twice_raises_runtime_error(self):
+        with pk.meta.Sampler() as sampler, pytest.raises(RuntimeError):
+            sampler.start()
+
+    @pytest.mark.parametrize(
+        "kwargs, expected",
+        [
+            ({"interval": 0}, "invalid interval=0; expected > 0"),
+            ({"max_depth": 0}, "invalid max_depth=0; expected >= 1"),
+        ],
+    )
+    def test_invalid_arguments_raise_value_error(self, kwargs, expected: str):
+        with pytest.raises(ValueError) as excinfo:
+            pk.meta.Sampler(**kwargs)
+        assert str(excinfo.value) == expected
+
+
+class _Allocator:
+    def build(self, n: int) -> list[str]:
+        return [f"item-{i:08d}" for i in range(n)]
+
+
+def _allocate_nested(n: int) -> list[list[int]]:
+    def inner() -> list[list[int]]:
+        return [[i] for i in range(n)]
+
+    return inner()
+
+
+class TestTrackAllocations:
+    def test_groups_growth_by_module_and_qualname(self):
+        with pk.meta.track_allocations(limit=None) as tracker:
+            kept = _Allocator().build(5000), _allocate_nested(5000)
+
+        sites = {(site.module, site.function): site for site in tracker.sites}
+        assert (__name__, "_Allocator.build") in sites
+        assert (__name__, "_allocate_nested.<locals>.inner") in sites
+        assert sites[(__name__, "_Allocator.build")].count >= 5000
+        assert all(site.size > 0 for site in tracker.sites)
+        del kept
+
+    def test_sites_sorted_by_size_and_limited(self):
+        with pk.meta.track_allocations(limit=1) as tracker:
+            kept = _Allocator().build(10000)
+
+        assert len(tracker.sites) == 1
+        assert tracker.sites[0].function == "_Allocator.build"
+        del kept
+
+    def test_exclude_attributes_to_first_outside_caller(self):
+        def consumer():
+            return list(pk.core.flatten([[i] * 3 for i in range(5000)]))
+
+        with pk.meta.track_allocations(nframe=5, exclude=["purekit"]) as tracker:
+            kept = consumer()
+
+        assert all(not site.module.startswith("purekit") for site in tracker.sites)
+        functions = {site.function for site in tracker.sites}
+        assert any(name.endswith("<locals>.consumer") for name in functions)
+        del kept
+
+    def test_decorator_usage(self):
+        tracker = pk.meta.track_allocations()
+
+        @tracker
+        def build():
+            return _Allocator().build(5000)
+
+        kept = build()
+        assert tracker.sites[0].function == "_Allocator.build"
+        del kept
+
+    def test_recursive_decorated_function_stops_tracing(self):
+        tracker = pk.meta.track_allocations()
+
+        @tracker
+        def rec(n: int) -> list[str]:
+            kept = _Allocator().build(1000)
+            return kept if n == 0 else kept + rec(n - 1)
+
+        assert len(rec(2)) == 3000
+        assert not tracemalloc.is_tracing()
+        assert "_Allocator.build" in [site.function for site in tracker.sites]
+
+    def test_nested_entries_of_same_instance(self):
+        tracker = pk.meta.track_allocations()
+        with tracker:
+            with tracker:
+                inner = _Allocator().build(1000)
+            inner_sites = tracker.sites
+            outer = _Allocator().build(3000)
+        assert not tracemalloc.is_tracing()
+        assert inner_sites[0].count < tracker.sites[0].count
+        del inner, outer
+
+    def test_concurrent_decorated_calls_stop_tracing(self):
+        tracker = pk.meta.track_allocations()
+        barrier = threading.Barrier(4)
+
+        @tracker
+        def build() -> list[str]:
+            barrier.wait()
+            return _Allocator().build(1000)
+
+        threads = [threading.Thread(target=build) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert not tracemalloc.is_tracing()
+
+    def test_attribution_caches_are_bounded(self, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setattr(pk.meta, "_FILE_MODULES_MAXSIZE", 1)
+        monkeypatch.setattr(pk.meta, "_SOURCE_SCOPES_MAXSIZE", 1)
+        monkeypatch.setattr(pk.meta, "_SOURCE_SCOPES", {})
+        with pk.meta.track_allocations() as tracker:
+            kept = _Allocator().build(1000)
+        assert tracker.sites[0].function == "_Allocator.build"
+        assert len(pk.meta._SOURCE_SCOPES) == 1
+        del kept
+
+    def test_unknown_file_is_not_cached(self):
+        filename = "<purekit-test-unknown>"
+        assert pk.meta._module_for_file(filename) == "<unknown>"
+        assert filename not in pk.meta._FILE_MODULES
+
+    def test_deeper_nframe_inside_shallower_tracker_raises(self):
+        with pk.meta.track_allocations():
+            inner = pk.meta.track_allocations(nframe=5, exclude=["purekit"])
+            with pytest.raises(RuntimeError) as excinfo, inner:
+                pass
+            with pk.meta.track_allocations(nframe=1):
+                pass
+        assert "already tracing with 1 frames" in str(excinfo.value)
+        assert not tracemalloc.is_tracing()
+
+    def test_checkpoint_compare(self):
+        with pk.meta.track_allocations(diff=False) as tracker:
+            before = tracker.checkpoint()
+            kept = _Allocator().build(5000)
+            after = tracker.checkpoint()
+
+        growth = tracker.compare(before, after)
+        assert growth[0].function == "_Allocator.build"
+        assert tracker.top(after)
+        del kept
+
+    def test_leaves_outer_tracing_running(self):
+        tracemalloc.start()
+        try:
+            with pk.meta.track_allocations():
+                pass
+            assert tracemalloc.is_tracing()
+        finally:
+            tracemalloc.stop()
+
+    def test_stops_tracing_it_started(self):
+        with pk.meta.track_allocations():
+            assert tracemalloc.is_tracing()
+        assert not tracemalloc.is_tracing()
+
+    @pytest.mark.parametrize(
+        "kwargs, expected",
+        [
+            ({"limit": 0}, "invalid limit=0; expected >= 1 or None"),
+            ({"nframe": 0}, "invalid nframe=0; expected >= 1"),
+        ],
+    )
+    def test_invalid_arguments_raise_value_error(self, kwargs, expected: str):
+        with pytest.raises(ValueError) as excinfo:
+            pk.meta.track_allocations(**kwargs)
+        assert str(excinfo.value) == expected
@@ -1,6 +1,13 @@
+import subprocess
+import sys
 from importlib import metadata
 from types import ModuleType
 
+import pytest
+
+# generous upper bound on the cumulative `import purekit` time, in microseconds
+IMPORT_BUDGET_US = 20_000
+
 
 def test_project_name(project_name: str, project_pkg: ModuleType):
     assert project_pkg.__name__ == project_name
@@ -8,3 +15,53 @@ def test_project_name(project_name: str, project_pkg: ModuleType):
 
 def test_project_version(project_name: str, project_pkg: ModuleType):
     assert project_pkg.__version__ == metadata.version(project_name)
+
+
+def test_submodules_are_accessible(project_pkg: ModuleType):
+    for name in ("bench", "core", "meta", "stats", "text"):
+        assert getattr(project_pkg, name).__name__ == f"{project_pkg.__name__}.{name}"
+        assert name in dir(project_pkg)
+
+
+def test_unknown_attribute_raises_attribute_error(project_pkg: ModuleType):
+    with pytest.raises(AttributeError):
+        project_pkg.missing  # noqa: B018
+
+
+def import_modules(statement: str) -> tuple[set[str], dict[str, int]]:
+    """Run an import in a fresh interpreter; return loaded modules and import times."""
+    code = f"{statement}; import sys; print(*sys.modules, sep='\\n')"
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    cumulative_us = {}
+    for line in result.stderr.splitlines():
+        if line.startswith("import time:") and "|" in line:
+            _, cumulative, name = line.split("|")
+            if cumulative.strip().isdigit():
+                cumulative_us[name.strip()] = int(cumulative)
+    return set(result.stdout.split()), cumulative_us
+
+
+def test_import_is_lazy(project_name: str):
+    modules, cumulative_us = import_modules(f"import {project_name}")
+    eager = {
+        f"{project_name}.bench",
+        f"{project_name}.core",
+        f"{project_name}.meta",
+        f"{project_name}.stats",
+        f"{project_name}.text",
+        "importlib.metadata",
+        "inspect",
+        "typing",
+    }
+    assert modules.isdisjoint(eager)
+    assert cumulative_us[project_name] < IMPORT_BUDGET_US
+
+
+def test_meta_does_not_import_inspect(project_name: str):
+    modules, _ = import_modules(f"import {project_name}.meta")
+    assert "inspect" not in modules
@@ -0,0 +1,128 @@
+import asyncio
+import re
+import threading
+import time
+
+import pytest
+
+import purekit as pk
+
+
+class TestCollect:
+    def test_disabled_by_default(self):
+        assert pk.stats.current() is None
+        assert list(pk.core.flatten([1, [2]])) == [1, 2]
+
+    def test_activates_collector_for_block(self):
+        with pk.stats.collect() as collector:
+            assert pk.stats.current() is collector
+        assert pk.stats.current() is None
+
+    def test_reuses_given_collector(self):
+        collector = pk.stats.Collector()
+        for _ in range(2):
+            with pk.stats.collect(collector):
+                list(pk.core.flatten([1]))
+        assert collector.snapshot()["core.flatten.calls"] == 2
+
+    def test_not_inherited_by_other_threads(self):
+        seen = []
+        with pk.stats.collect():
+            thread = threading.Thread(target=lambda: seen.append(pk.stats.current()))
+            thread.start()
+            thread.join()
+        assert seen == [None]
+
+    def test_isolated_per_asyncio_task(self):
+        async def count(n: int) -> dict:
+            with pk.stats.collect() as collector:
+                await asyncio.sleep(0)
+                list(pk.core.flatten([list(range(n))]))
+                await asyncio.sleep(0)
+            return collector.snapshot()
+
+        async def main() -> list[dict]:
+            return await asyncio.gather(count(1), count(10))
+
+        first, second = asyncio.run(main())
+        assert first["core.flatten.items"] == 2
+        assert second["core.flatten.items"] == 11
+
+
+class TestCollector:
+    def test_add_maximum_snapshot_reset(self):
+        collector = pk.stats.Collector()
+        collector.add({"b": 1, "a": 2.5})
+        collector.add({"b": 2})
+        collector.maximum("m", 3)
+        collector.maximum("m", 1)
+        assert collector.snapshot() == {"a": 2.5, "b": 3, "m": 3}
+        assert list(collector.snapshot()) == ["a", "b", "m"]
+        collector.reset()
+        assert collector.snapshot() == {}
+
+    def test_shared_between_threads(self):
+        collector = pk.stats.Collector()
+
+        def work() -> None:
+            with pk.stats.collect(collector):
+                for _ in range(100):
+                    list(pk.core.flatten([1, [2]]))
+
+        threads = [threading.Thread(target=work) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert collector.snapshot()["core.flatten.calls"] == 400
+
+
+class TestCounters:
+    def test_flatten(self):
+        with pk.stats.collect() as collector:
+            assert list(pk.core.flatten([1, [2, [3, []]], "ab"])) == [1, 2, 3, "ab"]
+        snapshot = collector.snapshot()
+        assert snapshot["core.flatten.calls"] == 1
+        assert snapshot["core.flatten.items"] == 7
+        assert snapshot["core.flatten.max_depth"] == 3
+        assert snapshot["core.flatten.seconds"] >= 0
+
+    def test_flatten_respects_max_depth(self):
+        with pk.stats.collect() as collector:
+            assert list(pk.core.flatten([1, [2, [3]]], max_depth=1)) == [1, 2, [3]]
+        assert collector.snapshot()["core.flatten.max_depth"] == 1
+
+    def test_flatten_partial_consumption_is_recorded(self):
+        with pk.stats.collect() as collector:
+            iterator = pk.core.flatten(range(100))
+            next(iterator)
+            iterator.close()
+        assert collector.snapshot()["core.flatten.items"] == 1
+
+    @pytest.mark.parametrize("workers", [None, 2])
+    def test_grep(self, workers: int | None):
+        lines = ["a1", "b", "c22", "d"]
+        with pk.stats.collect() as collector:
+            assert list(pk.text.grep(lines, r"\d", workers=workers)) == ["a1", "c22"]
+            list(pk.text.grep(lines, re.compile(r"\d"), workers=workers))
+        snapshot = collector.snapshot()
+        assert snapshot["text.grep.calls"] == 2
+        assert snapshot["text.grep.lines_scanned"] == 8
+        assert snapshot["text.grep.lines_matched"] == 4
+        assert snapshot["text.grep.regex_compiles"] == 1
+
+    def test_findall(self):
+        with pk.stats.collect() as collector:
+            result = list(pk.text.findall(["a1 2", "b", "c3"], r"\d"))
+        assert result == [["1", "2"], [], ["3"]]
+        snapshot = collector.snapshot()
+        assert snapshot["text.findall.calls"] == 1
+        assert snapshot["text.findall.lines_scanned"] == 3
+        assert snapshot["text.findall.matches"] == 3
+        assert snapshot["text.findall.regex_compiles"] == 1
+
+    def test_seconds_exclude_consumer_time(self):
+        with pk.stats.collect() as collector:
+            for _ in pk.text.grep(["a", "b"], r"."):
+                time.sleep(0.05)
+        assert collector.snapshot()["text.grep.seconds"] < 0.05
@@ -89,6 +89,20 @@ class TestConcat:
     def test_bytes_are_atomic_and_stringified(self):
         assert pk.text.concat([b"bytes", b"more"], sep=":") == "b'bytes':b'more'"
 
+    def test_memoryview_with_str_sep_raises_type_error(self):
+        with pytest.raises(TypeError, match="bytes-like sep"):
+            pk.text.concat(["a", memoryview(b"ab")])
+
+    @pytest.mark.parametrize("sep", [b",", bytearray(b","), memoryview(b",")])
+    def test_bytes_sep_returns_bytearray(self, sep):
+        items = [b"a", None, [bytearray(b"b"), memoryview(b"xcx")[1:2]], "d\u00e9", 1]
+        result = pk.text.concat(*items, sep=sep)
+        assert isinstance(result, bytearray)
+        assert result == "a,b,c,d\u00e9,1".encode()
+
+    def test_bytes_sep_empty(self):
+        assert pk.text.concat(sep=b"-") == bytearray()
+
     def test_concat_strings_basic_list(self):
         strings = ["Hello", "World"]
         result = pk.text.concat(strings, sep=" ")
@@ -174,6 +188,36 @@ class TestFindall:
         with pytest.raises(TypeError):
             list(pk.text.findall(strings, r"\d+"))
 
+    @pytest.mark.parametrize("workers, chunksize", [(1, 1), (2, 3), (4, 1024)])
+    def test_workers_preserve_order(self, workers: int, chunksize: int):
+        strings = [f"line {i} value {i * 7}" for i in range(1000)]
+        expected = list(pk.text.findall(strings, r"\d+"))
+        result = pk.text.findall(strings, r"\d+", workers=workers, chunksize=chunksize)
+        assert isinstance(result, Iterator)
+        assert list(result) == expected
+
+    @pytest.mark.parametrize(
+        "kwargs, expected",
+        [
+            ({"workers": 0}, "invalid workers=0; expected >= 1"),
+            ({"workers": 2, "chunksize": 0}, "invalid chunksize=0; expected >= 1"),
+        ],
+    )
+    def test_invalid_workers_raise_value_error(self, kwargs, expected: str):
+        with pytest.raises(ValueError) as excinfo:
+            list(pk.text.findall(["a"], r"a", **kwargs))
+        assert str(excinfo.value) == expected
+
+    def test_bytes_and_memoryview(self):
+        data = memoryview(b"id=1 x=22\nnothing\ny=3")
+        lines = [data[0:9], data[10:17], data[18:]]
+        result = list(pk.text.findall(lines, rb"\d+"))
+        assert result == [[b"1", b"22"], [], [b"3"]]
+
+    def test_str_pattern_on_bytes_raises_type_error(self):
+        with pytest.raises(TypeError):
+            list(pk.text.findall([b"abc"], r"a"))
+
 
 class TestGrep:
     def test_returns_iterator_and_yields_matching_texts(self):
@@ -208,6 +252,45 @@ class TestGrep:
         with pytest.raises(TypeError):
             list(pk.text.grep(strings, r"\d+"))
 
+    @pytest.mark.parametrize("workers, chunksize", [(1, 1), (2, 3), (4, 1024)])
+    def test_workers_preserve_order(self, workers: int, chunksize: int):
+        strings = [f"line {i}" for i in range(1000)]
+        expected = [string for string in strings if string.endswith("7")]
+        result = pk.text.grep(strings, r"7$", workers=workers, chunksize=chunksize)
+        assert list(result) == expected
+
+    @pytest.mark.parametrize("kind", [bytes, bytearray])
+    def test_bytes_lines(self, kind: type):
+        lines = [kind(b"ERROR x"), kind(b"info"), kind(b"error y")]
+        result = list(pk.text.grep(lines, rb"error"))
+        assert result == [kind(b"ERROR x"), kind(b"error y")]
+
+    def test_memoryview_slices_are_yielded_without_copies(self):
+        data = b"keep 1\ndrop\nkeep 2"
+        view = memoryview(data)
+        lines = [view[0:6], view[7:11], view[12:]]
+        result = list(pk.text.grep(lines, rb"keep", workers=2, chunksize=1))
+        assert [line.tobytes() for line in result] == [b"keep 1", b"keep 2"]
+        assert result[0] is lines[0]
+        assert result[0].obj is data
+
+    def test_workers_consume_input_lazily(self):
+        consumed = []
+
+        def strings():
+            for i in range(100_000):
+                consumed.append(i)
+                yield f"line {i}"
+
+        result = pk.text.grep(strings(), r"line", workers=2, chunksize=10)
+        assert next(result) == "line 0"
+        assert len(consumed) < 1000
+        result.close()
+
+    def test_workers_propagate_errors(self):
+        with pytest.raises(TypeError):
+            list(pk.text.grep(["ok", 123], r"\d+", workers=2, chunksize=1))
+
 
 class TestHeadline:
     def test_default_width(self):
@@ -332,3 +415,18 @@ class TestNumstr:
 def test_remove_punctuation(input_string: str, expected: str):
     result = pk.text.remove_punctuation(input_string)
     assert result == expected
+
+
+@pytest.mark.parametrize(
+    "input_string, expected",
+    [
+        (b"Hello, World!", b"Hello World"),
+        (bytearray(b"[a-b]"), bytearray(b"ab")),
+        (memoryview(b"xx(a.b)xx")[2:7], b"ab"),
+        ("Grüße, café!".encode(), "Grüße café".encode()),
+    ],
+)
+def test_remove_punctuation_bytes(input_string, expected):
+    result = pk.text.remove_punctuation(input_string)
+    assert result == expected
+    assert type(result) is type(expected)
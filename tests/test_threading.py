@@ -0,0 +1,102 @@
+"""Concurrent stress tests; most meaningful on free-threaded (no-GIL) builds."""
+
+import re
+import threading
+from collections.abc import Callable
+
+import pytest
+
+import purekit as pk
+
+THREADS = 8
+ROUNDS = 100
+
+
+def hammer(task: Callable[[], None], threads: int = THREADS) -> None:
+    """Run task ROUNDS times in each of several threads started together."""
+    barrier = threading.Barrier(threads)
+    errors: list[BaseException] = []
+
+    def worker() -> None:
+        barrier.wait()
+        try:
+            for _ in range(ROUNDS):
+                task()
+        except BaseException as exc:
+            errors.append(exc)
+
+    workers = [threading.Thread(target=worker) for _ in range(threads)]
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+    if errors:
+        raise errors[0]
+
+
+def test_flatten():
+    items = [[i, [i + 1, (i + 2,)]] for i in range(50)]
+    expected = list(pk.core.flatten(items))
+
+    def task() -> None:
+        assert list(pk.core.flatten(items)) == expected
+
+    hammer(task)
+
+
+def test_grep_and_findall_share_compiled_pattern():
+    regex = re.compile(r"\d+")
+    strings = [f"line {i}" for i in range(50)] + ["none"]
+
+    def task() -> None:
+        assert len(list(pk.text.grep(strings, regex))) == 50
+        assert list(pk.text.findall(strings, r"\d+"))[-2] == ["49"]
+
+    hammer(task)
+
+
+def test_numstr_and_concat():
+    def task() -> None:
+        assert pk.text.numstr(-1234567.25) == "-1_234_567.25"
+        assert pk.text.concat(["a", None, ["b", 1]], sep=",") == "a,b,1"
+
+    hammer(task)
+
+
+def test_meta_caller_helpers_with_cache_eviction(monkeypatch: pytest.MonkeyPatch):
+    # a tiny cache forces concurrent clears while other threads read and insert
+    monkeypatch.setattr(pk.meta, "_CODE_INFO_MAXSIZE", 2)
+    codes = [compile("caller_info()", f"<code-{i}>", "eval") for i in range(8)]
+    namespace = {"__name__": "generated", "caller_info": pk.meta.caller_info}
+
+    def task() -> None:
+        for code in codes:
+            info = eval(code, namespace)
+            assert (info.module, info.filename) == ("generated", code.co_filename)
+        marker = object()
+        assert pk.meta.get_caller_varnames(marker) == [["marker"]]
+
+    hammer(task)
+
+
+def test_sampler_while_threads_run():
+    items = [[i, [i]] for i in range(100)]
+
+    def task() -> None:
+        list(pk.core.flatten(items))
+
+    with pk.meta.Sampler(interval=0.0005) as sampler:
+        hammer(task)
+    assert sampler.samples > 0
+
+
+@pytest.mark.parametrize("workers", [2, 4])
+def test_threaded_text_functions_from_many_threads(workers: int):
+    strings = [f"line {i}" for i in range(500)]
+    expected = [string for string in strings if string.endswith("3")]
+
+    def task() -> None:
+        result = pk.text.grep(strings, r"3$", workers=workers, chunksize=16)
+        assert list(result) == expected
+
+    hammer(task, threads=4)